@@ -133,18 +133,14 @@ def get_common_books_among_versions(versions, get_verses_func, bible_data=None)
     Returns:
         list[str]: List of book keys common to all versions.
     """
-    book_sets = []
-    for version in versions:
-        books = bible_data.get_books_for_version(version)
-        if books:
-            book_sets.append(set(books))
+    # Key views of each loaded version's book dict; versions without data are skipped
+    book_sets = [books.keys() for books in map(get_verses_func, versions) if books]
 
     if not book_sets:
         return []
 
-    common_books = set.intersection(*book_sets)
-    canonical_order = list(bible_data.standard_book.keys())
-    return [b for b in canonical_order if b in common_books]
+    common_books = set(book_sets[0]).intersection(*book_sets[1:])
+    return [b for b in bible_data.standard_book if b in common_books]
 
 
 def validate_versions_and_books(versions, bible_data=None) -> tuple:
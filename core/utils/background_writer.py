@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+"""
+File: EuljiroBible/core/utils/background_writer.py
+Provides a background file writer that coalesces bursts of writes to the same path.
+
+Author: Benjamin Jaedon Choi - https://github.com/saintbenjamin
+Affiliated Church: The Eulji-ro Presbyterian Church [대한예수교장로회(통합) 을지로교회]
+Address: The Eulji-ro Presbyterian Church, 24-10, Eulji-ro 20-gil, Jung-gu, Seoul 04549, South Korea
+Telephone: +82-2-2266-3070
+E-mail: euljirochurch [at] G.M.A.I.L. (replace [at] with @ and G.M.A.I.L as you understood.)
+Copyright (c) 2025 The Eulji-ro Presbyterian Church.
+License: MIT License with Attribution Requirement (see LICENSE file for details)
+"""
+
+import queue
+import atexit
+import threading
+
+from core.utils.logger import log_error
+
+
+class BackgroundWriter:
+    """
+    Writes files on a daemon thread. Of each burst of submitted writes, only the newest
+    payload per path is written, in the order the paths were last submitted.
+
+    The thread is started by the first submit(), which also registers a flush of the
+    pending writes at interpreter exit; importers that never write pay for neither.
+    """
+
+    def __init__(self, name, write_func, on_error=None):
+        """
+        Initializes the writer without starting its thread.
+
+        Args:
+            name (str): Name of the writer thread.
+            write_func (callable): Called as write_func(path, payload) on the writer thread;
+                responsible for logging its own failures.
+            on_error (callable, optional): Called as on_error(path, exception) on the writer thread
+                when write_func raises.
+        """
+        self.name = name
+        self._write_func = write_func
+        self._on_error = on_error
+        self._queue = queue.Queue()
+        self._lock = threading.Lock()
+        self._started = False
+
+    def submit(self, path, payload):
+        """
+        Queues a payload to be written to path and returns immediately.
+
+        Args:
+            path (str): Destination file path.
+            payload (object): Data handed to write_func; must not be mutated after submitting.
+        """
+        self._ensure_started()
+        self._queue.put((path, payload))
+
+    def has_pending(self):
+        """
+        Returns whether a submitted write is still queued or being written.
+
+        Returns:
+            bool: True until every submitted payload has been handled.
+        """
+        return self._queue.unfinished_tasks > 0
+
+    def flush(self):
+        """
+        Blocks until every submitted payload has been handled.
+        """
+        self._queue.join()
+
+    def _ensure_started(self):
+        """
+        Starts the writer thread on first use and registers the exit-time flush.
+        """
+        if self._started:
+            return
+        with self._lock:
+            if self._started:
+                return
+            threading.Thread(target=self._run, name=self.name, daemon=True).start()
+
+            # Flush pending writes before the interpreter exits
+            atexit.register(self.flush)
+            self._started = True
+
+    def _run(self):
+        """
+        Drains the queue, writing only the newest payload per path of each burst.
+        """
+        while True:
+            pending = {}
+            path, payload = self._queue.get()
+            pending[path] = payload
+            taken = 1
+            while True:
+                try:
+                    path, payload = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                pending.pop(path, None)
+                pending[path] = payload
+                taken += 1
+
+            try:
+                for path, payload in pending.items():
+                    try:
+                        self._write_func(path, payload)
+                    except Exception as e:
+                        if self._on_error:
+                            try:
+                                self._on_error(path, e)
+                            except Exception as report_error:
+                                # A failing reporter must not stop the writer thread
+                                log_error(report_error)
+            finally:
+                for _ in range(taken):
+                    self._queue.task_done()
@@ -18,6 +18,30 @@ import json
 from core.config import paths
 from core.utils.logger import log_error
 
+# Process-wide loader for the default data directories, created by BibleDataLoader.shared()
+_shared_instance = None
+
+# Chapter label tuples ("1", ..., "N") by N, shared by every book and version with N chapters
+_CHAPTER_LABELS = {}
+
+
+def _chapter_labels_for(count):
+    """
+    Returns the shared chapter label tuple for a book with the given number of chapters.
+
+    Args:
+        count (int): Highest chapter number
+
+    Returns:
+        tuple: ("1", ..., str(count)), empty when count is 0
+    """
+    labels = _CHAPTER_LABELS.get(count)
+    if labels is None:
+        labels = tuple(map(str, range(1, count + 1)))
+        _CHAPTER_LABELS[count] = labels
+    return labels
+
+
 class BibleDataLoader:
     """
     Loads and lazily caches Bible-related JSON data: version aliases, book aliases, canonical names,
@@ -45,6 +69,26 @@ class BibleDataLoader:
 
         self.data = {}  # Cache for loaded Bible texts
 
+        # Derived per-version tables, filled on first use and dropped when a version is reloaded
+        self._chapter_labels = {}  # version -> {book: ("1", ..., "N")}
+        self._max_verses = {}  # version -> {(book, chapter): highest verse number}
+
+    @classmethod
+    def shared(cls):
+        """
+        Returns the process-wide loader for the default data directories, creating it on first use.
+
+        Every GUI component that reads Bible data shares this instance, so each version's text
+        is loaded and held in memory once.
+
+        Returns:
+            BibleDataLoader: Shared loader instance
+        """
+        global _shared_instance
+        if _shared_instance is None:
+            _shared_instance = cls()
+        return _shared_instance
+
     def get_verses(self, version):
         """
         Retrieves all verses for a given Bible version, loading from disk if needed.
@@ -128,6 +172,10 @@ class BibleDataLoader:
             version_key (str): Version file name without extension
         """
         path = os.path.join(self.text_dir, f"{version_key}.json")
+
+        # Only this version's derived tables go stale; other versions keep theirs
+        self._chapter_labels.pop(version_key, None)
+        self._max_verses.pop(version_key, None)
         try:
             with open(path, "r", encoding="utf-8") as f:
                 self.data[version_key] = json.load(f)
@@ -146,17 +194,37 @@ class BibleDataLoader:
         for v in target_versions:
             self.load_version(v)
 
+    def get_chapter_labels(self, version, book):
+        """
+        Returns the chapter choices "1".."N" for a book, where N is its highest chapter number.
+
+        Args:
+            version (str): Bible version key
+            book (str): Book name
+
+        Returns:
+            tuple: Chapter numbers as strings, empty if the book is not in the version
+        """
+        version_labels = self._chapter_labels.setdefault(version, {})
+        labels = version_labels.get(book)
+        if labels is None:
+            chapters = self.get_verses(version).get(book, {})
+            labels = _chapter_labels_for(max(map(int, chapters), default=0))
+            version_labels[book] = labels
+        return labels
+
     def get_max_verse(self, version, book, chapter):
         version_data = self.data.get(version)
         if not version_data:
             return 0
-        book_data = version_data.get(book)
-        if not book_data:
-            return 0
-        chapter_data = book_data.get(str(chapter))
-        if not chapter_data:
-            return 0
-        return max(map(int, chapter_data.keys()), default=0)
+        version_max = self._max_verses.setdefault(version, {})
+        key = (book, chapter)
+        max_verse = version_max.get(key)
+        if max_verse is None:
+            chapter_data = version_data.get(book, {}).get(str(chapter))
+            max_verse = max(map(int, chapter_data), default=0) if chapter_data else 0
+            version_max[key] = max_verse
+        return max_verse
 
     def extract_verses(self, versions, book, chapter, verse_range):
         """
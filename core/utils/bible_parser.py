@@ -27,6 +27,25 @@ except Exception as e:
     BOOK_ALIASES = {}
 # ─────────────────────────────────────────────
 
+def _normalize_book_name(name: str) -> str:
+    """
+    Normalize a book name for comparison: lowercase, without spaces or dots.
+
+    :param name: Book name or alias
+    :return: Normalized name
+    """
+    return name.strip().lower().replace(" ", "").replace(".", "")
+
+# Normalized alias → canonical ID, and normalized canonical ID → canonical ID.
+# Built once so lookups do not re-normalize every alias per call; the first match wins,
+# as in the original linear scans.
+_ALIAS_LOOKUP = {}
+for _alias, _canonical in BOOK_ALIASES.items():
+    _ALIAS_LOOKUP.setdefault(_normalize_book_name(_alias), _canonical)
+_CANONICAL_LOOKUP = {}
+for _canonical in BOOK_ALIASES.values():
+    _CANONICAL_LOOKUP.setdefault(_normalize_book_name(_canonical), _canonical)
+
 def resolve_book_name(name: str, lang_map: dict = None, lang_code: str = "ko") -> str | None:
     """
     Resolve a user-provided book name (alias or standard) to the canonical internal ID.
@@ -45,19 +64,17 @@ def resolve_book_name(name: str, lang_map: dict = None, lang_code: str = "ko") -
     if not name:
         return None
 
-    raw = name.strip()
-    normalized = raw.lower().replace(" ", "").replace(".", "")
+    normalized = _normalize_book_name(name)
 
     # 1. Try direct alias match (with normalization)
-    for alias, canonical in BOOK_ALIASES.items():
-        alias_norm = alias.strip().lower().replace(" ", "").replace(".", "")
-        if normalized == alias_norm:
-            return canonical
+    canonical = _ALIAS_LOOKUP.get(normalized)
+    if canonical is not None:
+        return canonical
 
     # 2. Reverse match if name is already canonical
-    for canonical in BOOK_ALIASES.values():
-        if normalized == canonical.lower().replace(" ", "").replace(".", ""):
-            return canonical
+    canonical = _CANONICAL_LOOKUP.get(normalized)
+    if canonical is not None:
+        return canonical
 
     # 3. Fallback: optional standard book name matching
     if lang_map:
@@ -19,6 +19,7 @@ import time
 import platform
 
 from core.config import paths
+from core.utils.background_writer import BackgroundWriter
 from core.utils.logger import log_error
 
 
@@ -228,4 +229,44 @@ def save_to_files(merged, settings, parent=None):
                 parent.tr("error_saving_msg_path").format(rel_path, e)
             )
         else:
-            log_error(e)
\ No newline at end of file
+            log_error(e)
+
+
+def _write_output(path, text):
+    """
+    Writes one queued output file for the background output writer.
+
+    Failures are logged here; dialogs cannot be shown off the GUI thread.
+
+    Args:
+        path (str): Output file path.
+        text (str): Final display text to save.
+    """
+    try:
+        atomic_write(path, text)
+    except Exception:
+        # atomic_write already logged the failure
+        return
+    try:
+        # Force modified time update to trigger file system watchers
+        os.utime(path, None)
+    except OSError as e:
+        log_error(e)
+
+
+# Writes verse output off the GUI thread; started by the first save_to_files_async call
+_output_writer = BackgroundWriter("OutputWriter", _write_output)
+
+
+def save_to_files_async(merged, settings):
+    """
+    Queues the final merged text for writing on the background output writer and returns immediately.
+
+    The output path is resolved on the calling thread, so invalid settings still raise here.
+    Write failures are logged, as save_to_files does without a parent widget.
+
+    Args:
+        merged (str): Final display text to save.
+        settings (dict): Configuration containing output path.
+    """
+    _output_writer.submit(resolve_output_path(settings), merged)
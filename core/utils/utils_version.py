@@ -29,7 +29,7 @@ def refresh_full_version_list():
         >>> refresh_full_version_list()
         ['KJV', 'NIV', 'NKRV', 'RSV']
     """
-    loader = BibleDataLoader()
+    loader = BibleDataLoader.shared()
 
     try:
         # Collect .json files as version keys
@@ -13,10 +13,7 @@ License: MIT License with Attribution Requirement (see LICENSE file for details)
 """
 
 from PySide6.QtWidgets import QCheckBox, QLayoutItem
-from core.logic.verse_logic import (
-    get_common_books_among_versions,
-    validate_versions_and_books,
-)
+from core.logic.verse_logic import get_common_books_among_versions
 
 class VerseVersionHelper:
     """
@@ -28,6 +25,9 @@ class VerseVersionHelper:
     :type version_layout: QLayout
     """
 
+    # Sorted orderings keyed by input tuple; version metadata is loaded once per process
+    _sort_cache = {}
+
     def __init__(self, bible_data, version_layout):
         """
         Initialize the helper with data source and layout.
@@ -39,11 +39,36 @@ class VerseVersionHelper:
         """
         self.bible_data = bible_data
         self.version_layout = version_layout
+        self._selected = None  # Checked version keys in layout order; None until next scan
+        self._common_books = {}  # frozenset of selected versions -> common books
+
+    def invalidate_selection(self):
+        """
+        Forgets the cached selection so the next query rescans the checkboxes.
+
+        Must be called whenever a version checkbox changes state, including changes made
+        with signals blocked.
+        """
+        self._selected = None
 
     def get_selected_versions(self):
         """
         Returns a list of selected Bible versions based on checked checkboxes.
 
+        The layout is only scanned after the selection was invalidated; otherwise the
+        cached result is returned.
+
+        :return: List of selected version keys
+        :rtype: list[str]
+        """
+        if self._selected is None:
+            self._selected = tuple(self._scan_selected_versions())
+        return list(self._selected)
+
+    def _scan_selected_versions(self):
+        """
+        Walks the version layout and collects the keys of checked checkboxes.
+
         :return: List of selected version keys
         :rtype: list[str]
         """
@@ -70,14 +95,19 @@ class VerseVersionHelper:
         if not versions:
             return []
 
-        # Use helper logic to find common books across versions
+        # Reuse the result for any version set seen before; the selection order does not matter
+        key = frozenset(versions)
+        cached = self._common_books.get(key)
+        if cached is not None:
+            return list(cached)
+
+        # Use helper logic to find common books across versions;
+        # the result is already limited to and ordered by the standard book list
         common_books = get_common_books_among_versions(
             versions, self.bible_data.get_verses, self.bible_data
         )
-
-        # Only keep books that are recognized in the standard book list
-        all_books = list(self.bible_data.standard_book.keys())
-        return [b for b in all_books if b in common_books]
+        self._common_books[key] = tuple(common_books)
+        return common_books
 
     def validate_selection(self, initializing=False):
         """
@@ -92,9 +122,11 @@ class VerseVersionHelper:
             return self.get_selected_versions(), self.get_common_books()
 
         # Validate selected versions and compute shared books
+        # (same contract as validate_versions_and_books, served from the cache)
         versions = self.get_selected_versions()
-        validated_versions, common_books = validate_versions_and_books(versions, self.bible_data)
-        return validated_versions, common_books
+        if not versions:
+            return None, None
+        return versions, self.get_common_books() or None
 
     def sort_versions(self, version_list):
         """
@@ -105,13 +137,14 @@ class VerseVersionHelper:
         :return: Sorted list of version keys
         :rtype: list[str]
         """
-        # Sort by the global sort key first
+        key = tuple(version_list)
+        cached = self._sort_cache.get(key)
+        if cached is not None:
+            # Same input seen before: reuse its ordering, still sorting in place
+            version_list[:] = cached
+            return version_list
+
+        # Single pass: (prefix order, name) is the whole ordering
         version_list.sort(key=self.bible_data.get_sort_key())
-
-        def custom_sort_key(version):
-            prefix = version.split()[0]
-            # Apply secondary sorting based on prefix ordering
-            return (self.bible_data.sort_order.get(prefix, 99), version)
-
-        version_list.sort(key=custom_sort_key)
-        return version_list
\ No newline at end of file
+        self._sort_cache[key] = tuple(version_list)
+        return version_list
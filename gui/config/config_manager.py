@@ -14,13 +14,19 @@ License: MIT License with Attribution Requirement (see LICENSE file for details)
 """
 
 import os
+import copy
 import json
 import platform
+from contextlib import contextmanager
+from PySide6.QtCore import QObject, Signal, Slot
 from PySide6.QtWidgets import QApplication, QMessageBox
 from PySide6.QtGui import QFontDatabase, QFont
 
 from core.config import paths
+from core.utils.background_writer import BackgroundWriter
 from core.utils.logger import log_debug
+from core.utils.utils_output import atomic_write
+from gui.constants import messages
 from gui.utils.logger import log_error_with_dialog
 
 
@@ -49,6 +55,60 @@ DEFAULT_SETTINGS = {
 }
 
 
+def _write_settings(path, data):
+    """
+    Serializes and writes one settings snapshot for the background settings writer.
+
+    Args:
+        path (str): Settings file path.
+        data (dict): Settings snapshot to write.
+    """
+    atomic_write(path, json.dumps(data, ensure_ascii=False, indent=2))
+
+
+class _SettingsWriteErrorNotifier(QObject):
+    """
+    Carries settings write failures from the writer thread to the GUI thread.
+
+    The notifier lives on the thread that imported this module (the GUI thread), so the
+    signal emitted by the writer thread is delivered there through a queued connection.
+    """
+
+    failed = Signal(str)
+
+    def __init__(self):
+        """
+        Connects the failure signal to the dialog slot.
+        """
+        super().__init__()
+        self.failed.connect(self._show_error)
+
+    @Slot(str)
+    def _show_error(self, error_text):
+        """
+        Tells the user that the settings could not be saved; the failure is already logged.
+
+        Args:
+            error_text (str): Description of the write failure.
+        """
+        msg = f"{messages.ERROR_MESSAGES['settings_save']}\n\n{error_text}"
+        if QApplication.instance():
+            QMessageBox.critical(None, "Settings Save Error", msg)
+        else:
+            print(f"[Error] Settings Save Error: {msg}")
+
+
+_write_error_notifier = _SettingsWriteErrorNotifier()
+
+# Writes settings off the GUI thread; started by the first save() call.
+# atomic_write logs failures; the notifier reports them to the user from the GUI thread.
+_settings_writer = BackgroundWriter(
+    "ConfigWriter",
+    _write_settings,
+    on_error=lambda path, e: _write_error_notifier.failed.emit(str(e))
+)
+
+
 class ConfigManager:
     """
     Manages loading, saving, and modifying user settings for the application.
@@ -57,6 +117,13 @@ class ConfigManager:
     BASE_DIR = paths.BASE_DIR
     DEFAULT_OUTPUT_PATH = os.path.join(paths.BASE_DIR, "verse_output.txt")
 
+    # Nesting depth of batched() blocks and the partial updates deferred meanwhile
+    _batch_depth = 0
+    _pending_updates = {}
+
+    # Last snapshot handed to the writer thread; served by load() until it reaches disk
+    _latest_snapshot = None
+
     @staticmethod
     def get_icon_dir():
         """
@@ -87,9 +154,19 @@ class ConfigManager:
         """
         log_debug("[ConfigManager] settings loaded")
 
-        # If no settings file, write defaults first
+        # The file on disk is stale while a write is still queued or in flight; this is checked
+        # first so a settings file that does not exist yet is not re-seeded with defaults
+        if _settings_writer.has_pending():
+            settings = copy.deepcopy(ConfigManager._latest_snapshot)
+            settings.update(ConfigManager._pending_updates)
+            return settings
+
+        # If no settings file and nothing on its way to disk, write defaults first
         if not os.path.exists(paths.SETTINGS_FILE):
             ConfigManager.save(DEFAULT_SETTINGS)
+            settings = copy.deepcopy(DEFAULT_SETTINGS)
+            settings.update(ConfigManager._pending_updates)
+            return settings
 
         try:
             with open(paths.SETTINGS_FILE, encoding="utf-8") as f:
@@ -102,6 +179,8 @@ class ConfigManager:
                 if "output_path" not in settings:
                     settings["output_path"] = ConfigManager.DEFAULT_OUTPUT_PATH
 
+                # Include updates deferred by an open batched() block
+                settings.update(ConfigManager._pending_updates)
                 return settings
 
         except (FileNotFoundError, ValueError) as e:
@@ -136,16 +215,17 @@ class ConfigManager:
         """
         Saves the given settings dictionary to the `settings.json` file.
 
+        The write happens on a background thread; a snapshot of the data is queued
+        and this call returns immediately. Write failures are reported by a dialog
+        raised on the GUI thread, not to the caller.
+
         Args:
             data (dict): The settings to save.
         """
         log_debug("[ConfigManager] settings saved")
-        try:
-            with open(paths.SETTINGS_FILE, "w", encoding="utf-8") as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
-        except Exception as e:
-            log_error_with_dialog(e)
-            raise
+        snapshot = copy.deepcopy(data)
+        ConfigManager._latest_snapshot = snapshot
+        _settings_writer.submit(paths.SETTINGS_FILE, snapshot)
 
     @staticmethod
     def update_partial(data):
@@ -156,10 +236,43 @@ class ConfigManager:
             data (dict): Partial key-value pairs to update.
         """
         log_debug(f"[ConfigManager] settings partially updated: {data}")
+        if ConfigManager._batch_depth:
+            ConfigManager._pending_updates.update(data)
+            return
         settings = ConfigManager.load()
         settings.update(data)
         ConfigManager.save(settings)
 
+    @staticmethod
+    @contextmanager
+    def batched():
+        """
+        Defers update_partial writes until the outermost batched block exits.
+
+        All partial updates made inside the block are written with a single save.
+        load() sees the deferred values in the meantime; full save() calls still write immediately.
+        """
+        ConfigManager._batch_depth += 1
+        try:
+            yield
+        finally:
+            ConfigManager._batch_depth -= 1
+            if not ConfigManager._batch_depth:
+                ConfigManager._flush()
+
+    @staticmethod
+    def _flush():
+        """
+        Writes partial updates deferred by batched(), if any.
+        """
+        pending = ConfigManager._pending_updates
+        if not pending:
+            return
+        ConfigManager._pending_updates = {}
+        settings = ConfigManager.load()
+        settings.update(pending)
+        ConfigManager.save(settings)
+
     @staticmethod
     def get_default_font():
         """
@@ -196,10 +309,8 @@ class ConfigManager:
             size (int): Font size.
             weight (int): Font weight value.
         """
-        settings = ConfigManager.load()
-        settings.update({
+        ConfigManager.update_partial({
             "font_family": family,
             "font_size": size,
             "font_weight": weight
-        })
-        ConfigManager.save(settings)
\ No newline at end of file
+        })
\ No newline at end of file
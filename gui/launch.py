@@ -43,9 +43,8 @@ def launch(app, saved_versions, settings, app_version):
 
     saved_versions = settings.get("last_versions", ["대한민국 개역개정 (1998)"])
 
-    # Load only versions used last session (lazy load)
-    bible_loader = BibleDataLoader()
-    bible_loader.load_versions(saved_versions)
+    # Preload only versions used last session into the loader the tabs share (lazy load for the rest)
+    BibleDataLoader.shared().load_versions(saved_versions)
 
     # Set platform-specific icon (ICO for Windows, SVG otherwise)
     if platform.system() == "Windows":
@@ -98,6 +97,9 @@ def launch(app, saved_versions, settings, app_version):
             if is_checked and first_checked_item is None:
                 first_checked_item = widget
 
+    # Checkboxes were set with signals blocked, so the helper's cached selection is stale
+    tab_verse.version_helper.invalidate_selection()
+
     # Restore last selected book/chapter/verse if present
     if saved_book:
         display_name = win.tab_verse.bible_data.get_standard_book(saved_book, win.current_language)
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 """
 File: EuljiroBible/gui/ui/common.py
-Provides reusable UI widgets such as buttons, checkboxes, and loading indicator.
+Provides reusable UI widgets such as buttons, checkboxes, a lazy font combo box, and loading indicator.
 Includes utility wrappers for QPushButton creation with SVG icons and dynamic sizing.
 
 Author: Benjamin Jaedon Choi - https://github.com/saintbenjamin
@@ -13,10 +13,14 @@ Copyright (c) 2025 The Eulji-ro Presbyterian Church.
 License: MIT License with Attribution Requirement (see LICENSE file for details)
 """
 
-from PySide6.QtWidgets import QPushButton, QCheckBox, QWidget, QApplication, QSizePolicy
+from functools import lru_cache
+
+from PySide6.QtWidgets import QPushButton, QCheckBox, QComboBox, QListView, QWidget, QSizePolicy
 from PySide6.QtCore import Qt, QTimer, QSize
 from PySide6.QtGui import QPainter, QPen, QIcon
 
+from gui.utils.utils_fonts import get_scalable_families
+
 
 def create_button(text, callback=None):
     """
@@ -35,6 +39,24 @@ def create_button(text, callback=None):
     return btn
 
 
+def set_button_color(button, hex_color):
+    """
+    Shows a color on a color-picker button and remembers it as the button's chosen color.
+
+    The chosen color is kept in `button.color_hex` and should be read back from there:
+    the palette reflects the active style (e.g. the dark theme), not the swatch.
+    The style sheet is only rewritten when the color actually changes.
+
+    Args:
+        button (QPushButton): The button to color.
+        hex_color (str): Color in #RRGGBB form.
+    """
+    if getattr(button, "color_hex", None) == hex_color:
+        return
+    button.color_hex = hex_color
+    button.setStyleSheet(f"background-color: {hex_color}")
+
+
 def create_checkbox(text, checked=False, callback=None):
     """
     Creates a QCheckBox with optional initial state and signal connection.
@@ -54,6 +76,23 @@ def create_checkbox(text, checked=False, callback=None):
     return cb
 
 
+@lru_cache(maxsize=64)
+def _load_svg_icon(svg_path):
+    """
+    Loads an SVG icon once per path and shares it between buttons.
+
+    QIcon is implicitly shared and keeps its own per-size pixmap cache, so every
+    button built from the same file reuses one parse and one rasterization.
+
+    Args:
+        svg_path (str): Path to SVG icon.
+
+    Returns:
+        QIcon: Icon backed by the SVG file.
+    """
+    return QIcon(svg_path)
+
+
 def create_svg_text_button(svg_path, text, icon_size=20, tooltip="", callback=None):
     """
     Creates a QPushButton with SVG icon and text.
@@ -69,10 +108,9 @@ def create_svg_text_button(svg_path, text, icon_size=20, tooltip="", callback=No
         QPushButton: The configured icon + text button.
     """
     btn = QPushButton(text)
-    icon = QIcon(svg_path)
+    icon = _load_svg_icon(svg_path)
     btn.setIcon(icon)
     btn.setIconSize(QSize(icon_size, icon_size))
-    btn.setFont(QApplication.font())
     btn.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Fixed)
     btn.setMinimumHeight(btn.sizeHint().height())
 
@@ -84,6 +122,73 @@ def create_svg_text_button(svg_path, text, icon_size=20, tooltip="", callback=No
     return btn
 
 
+class LazyFontComboBox(QComboBox):
+    """
+    Font family selector that enumerates installed fonts only when its popup is first opened.
+
+    Unlike QFontComboBox, construction does not scan the font database; until the popup is
+    shown, the combo holds just the selected family.
+    """
+
+    def __init__(self, parent=None):
+        """
+        Initializes an empty, unpopulated combo box.
+
+        Args:
+            parent (QWidget, optional): Parent widget. Defaults to None.
+        """
+        super().__init__(parent)
+        self._populated = False
+
+        # Hundreds of same-height rows: skip per-row size hints and lay them out in batches
+        view = QListView(self)
+        view.setUniformItemSizes(True)
+        view.setLayoutMode(QListView.Batched)
+        view.setBatchSize(64)
+        self.setView(view)
+
+        # Use the scrolling list popup rather than a menu sized to fit every item
+        self.setStyleSheet("QComboBox { combobox-popup: 0; }")
+
+    def setCurrentText(self, text):
+        """
+        Selects a family, adding it as an item first if the list is not populated yet.
+
+        Args:
+            text (str): Font family name.
+        """
+        if self.findText(text) < 0 and not self._populated:
+            self.addItem(text)
+        super().setCurrentText(text)
+
+    def showPopup(self):
+        """
+        Fills the list from the shared scalable font family cache on first use, then shows the popup.
+        """
+        if not self._populated:
+            self._populate()
+        super().showPopup()
+
+    def _populate(self):
+        """
+        Replaces the placeholder item with all scalable font families, keeping the selection.
+        """
+        self._populated = True
+        current = self.currentText()
+        families = get_scalable_families()
+
+        # The selection does not change, so no change signals are needed
+        blocked = self.blockSignals(True)
+        try:
+            self.clear()
+            self.addItems(families)
+            if current and self.findText(current) < 0:
+                self.insertItem(0, current)
+            self.setCurrentIndex(max(self.findText(current), 0))
+        finally:
+            self.blockSignals(blocked)
+
+
 class LoadingIndicator(QWidget):
     """
     A spinning arc-based loading indicator widget.
@@ -49,7 +49,7 @@ class TabKeyword(QWidget, TabKeywordUI):
         self.tr = tr
         self.settings = settings
         self.current_language = "ko"
-        self.bible_data = BibleDataLoader()
+        self.bible_data = BibleDataLoader.shared()
         self.logic = TabKeywordLogic(settings, tr)
 
         # Inject fallback functions if not provided
@@ -18,7 +18,7 @@ from PySide6.QtWidgets import QMessageBox
 from core.utils.bible_keyword_searcher import BibleKeywordSearcher
 from core.utils.bible_parser import resolve_book_name
 from core.utils.logger import log_debug
-from core.utils.utils_output import format_output, save_to_files
+from core.utils.utils_output import format_output, save_to_files_async
 
 from gui.utils.keyword_result_model import KeywordResultTableModel
 from gui.utils.keyword_highlight_delegate import KeywordHighlightDelegate
@@ -143,8 +143,8 @@ class TabKeywordLogic:
         )
 
         try:
-            save_to_files(merged, parent.settings)
-            log_debug("[TabKeyword] selected verse saved successfully")
+            save_to_files_async(merged, parent.settings)
+            log_debug("[TabKeyword] selected verse queued for saving")
         except Exception as e:
             QMessageBox.critical(parent, self.tr("error_saving_title"), self.tr("error_saving_msg").format(e))
 
@@ -155,7 +155,7 @@ class TabKeywordLogic:
         :param parent: TabKeyword instance
         :type parent: QWidget
         """
-        save_to_files("", parent.settings)
+        save_to_files_async("", parent.settings)
 
     def update_table(self, parent, results):
         """
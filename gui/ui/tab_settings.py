@@ -12,7 +12,10 @@ Copyright (c) 2025 The Eulji-ro Presbyterian Church.
 License: MIT License with Attribution Requirement (see LICENSE file for details)
 """
 
-from PySide6.QtCore import QTimer, QCoreApplication
+import os
+import time
+
+from PySide6.QtCore import QTimer, QEvent, QFileSystemWatcher
 from PySide6.QtWidgets import QWidget, QMessageBox, QApplication
 
 from core.utils.file_helpers import should_show_overlay
@@ -20,7 +23,7 @@ from core.utils.logger import log_debug
 from gui.config.config_manager import ConfigManager
 from gui.ui.locale.message_loader import load_messages
 from gui.ui.tab_settings_ui import TabSettingsUI
-from gui.ui.tab_settings_logic import TabSettingsLogic
+from gui.ui.tab_settings_logic import TabSettingsLogic, get_poll_timer_type, WATCH_SAFETY_INTERVAL
 from gui.utils.overlay_factory import create_overlay
 from gui.utils.utils_display import get_display_descriptions
 from gui.utils.utils_theme import set_dark_mode
@@ -31,6 +34,37 @@ class TabSettings(QWidget, TabSettingsUI):
     overlay display configuration, file output path, and polling mechanism.
     """
 
+    # Translated widgets as (attribute, setter, [index,] message key); see _apply_lang_spec
+    _LANG_SPEC = (
+        # Main settings section
+        ("font_family_label", "setText", "label_font_family"),
+        ("font_size_label", "setText", "label_font_size"),
+        ("font_weight_label", "setText", "label_font_weight"),
+        ("theme_toggle_btn", "setText", "btn_theme_toggle"),
+        ("main_group", "setTitle", "setting_main"),
+        ("overlay_group", "setTitle", "setting_overlay"),
+        ("always_on_off_checkbox", "setText", "checkbox_show_on_off"),
+    )
+
+    # Overlay and polling section; only applied once the overlay group has been built
+    _OVERLAY_LANG_SPEC = (
+        ("poll_label", "setText", "label_poll_interval"),
+        ("poll_save", "setText", "btn_poll_interval_save"),
+        ("overlay_mode_combo", "setItemText", 0, "fullscreen"),
+        ("overlay_mode_combo", "setItemText", 1, "resizable"),
+        ("display_font_family_label", "setText", "label_font_family"),
+        ("display_font_size_label", "setText", "label_font_size"),
+        ("display_font_weight_label", "setText", "label_font_weight"),
+        ("display_font_color_label", "setText", "label_display_font_color"),
+        ("bg_color_label", "setText", "label_display_bg_color"),
+        ("bg_alpha_label", "setText", "label_display_bg_alpha"),
+        ("path_label", "setText", "label_path"),
+        ("browse_btn", "setText", "btn_browse"),
+    )
+
+    # Shown at most once per process, so kept on the class rather than the instance
+    _warned_display_once = False
+
     def __init__(self, app, settings, tr, get_poll_enabled_callback=None, get_main_geometry=None, refresh_settings_callback=None):
         """
         Initializes the settings tab with provided context.
@@ -50,18 +84,43 @@ class TabSettings(QWidget, TabSettingsUI):
         self.settings = settings
         self.verse_path = self.settings.get("output_path", "verse_output.txt")
 
-        # Timer for polling verse output file
+        # (mtime_ns, size) of the verse file seen by the last poll
+        self._last_stat = (0, 0)
+
+        # File change notifications drive polling; the timer covers the first check, any period
+        # where the verse file cannot be watched (e.g. it does not exist yet), and a slow safety re-check
+        self.poll_watcher = QFileSystemWatcher(self)
+        self.poll_watcher.fileChanged.connect(self._on_verse_file_changed)
+
+        poll_interval = self.settings.get("poll_interval", 1000)
+        # Single-shot chain: each tick schedules the next one, minus the time the tick itself took
         self.poll_timer = QTimer(self)
-        self.poll_timer.timeout.connect(self.poll_file)
+        self.poll_timer.setSingleShot(True)
+        self.poll_timer.setTimerType(get_poll_timer_type(poll_interval))
+        self.poll_timer.timeout.connect(self._on_poll_timer)
+        self._poll_period = poll_interval
+        self._poll_ticks = 0
+        self._poll_due = None
+        self._poll_paused = False
         if self.settings.get("poll_enabled", False):
-            self.poll_timer.start(self.settings.get("poll_interval", 1000))
+            self.poll_timer.start(poll_interval)
+            self._poll_due = time.monotonic() + poll_interval / 1000
 
         self.get_main_geometry = get_main_geometry or self.get_main_geometry
         self.refresh_settings_callback = refresh_settings_callback or (lambda: None)
 
         self.overlay = None
+
+        # Cached fullscreen overlay placement, invalidated on screen or window changes
+        self._overlay_target_cache = None
+        self._watched_window = None
+        app.screenAdded.connect(self._on_screen_added)
+        app.screenRemoved.connect(self._invalidate_overlay_target)
+        for screen in QApplication.screens():
+            screen.geometryChanged.connect(self._invalidate_overlay_target)
+
         self.get_poll_enabled = get_poll_enabled_callback or (lambda: False)
-        self.logic = TabSettingsLogic(app, settings, tr, refresh_settings_callback)
+        self.logic = TabSettingsLogic(settings, app, tr, refresh_settings_callback)
 
         self.init_ui()
 
@@ -75,40 +134,53 @@ class TabSettings(QWidget, TabSettingsUI):
         self.current_language = lang_code
         self.messages = load_messages(lang_code)
 
-        # Main settings section
-        self.font_family_label.setText(self.tr("label_font_family"))
-        self.font_size_label.setText(self.tr("label_font_size"))
-        self.font_weight_label.setText(self.tr("label_font_weight"))
-        self.theme_toggle_btn.setText(self.tr("btn_theme_toggle"))
-        self.main_group.setTitle(self.tr("setting_main"))
-
-        # Overlay and polling section
-        self.overlay_group.setTitle(self.tr("setting_overlay"))
-        self.poll_label.setText(self.tr("label_poll_interval"))
-        self.poll_save.setText(self.tr("btn_poll_interval_save"))
-        self.always_on_off_checkbox.setText(self.tr("checkbox_show_on_off"))
-        self.overlay_mode_combo.setItemText(0, self.tr("fullscreen"))
-        self.overlay_mode_combo.setItemText(1, self.tr("resizable"))
-        self.display_font_family_label.setText(self.tr("label_font_family"))
-        self.display_font_size_label.setText(self.tr("label_font_size"))
-        self.display_font_weight_label.setText(self.tr("label_font_weight"))
-        self.display_font_color_label.setText(self.tr("label_display_font_color"))
-        self.bg_color_label.setText(self.tr("label_display_bg_color"))
-        self.bg_alpha_label.setText(self.tr("label_display_bg_alpha"))
-        self.path_label.setText(self.tr("label_path"))
-        self.browse_btn.setText(self.tr("btn_browse"))
+        self._apply_lang_spec(self._LANG_SPEC)
+        if self._overlay_built:
+            self._apply_lang_spec(self._OVERLAY_LANG_SPEC)
 
         # Save selected language
         self.settings["last_language"] = lang_code
         ConfigManager.update_partial({"last_language": lang_code})
 
-    def apply_dynamic_settings(self):
+    def _apply_lang_spec(self, spec):
+        """
+        Relabels the widgets listed in a language spec with the current translations.
+
+        Each entry calls ``self.<attr>.<setter>([index,] tr(<key>))``; the optional index
+        addresses an item, e.g. a combo box entry for setItemText.
+
+        :param spec: Entries of (attribute, setter, [index,] message key)
+        :type spec: tuple
+        """
+        tr = self.tr
+        for attr, setter, *args in spec:
+            getattr(getattr(self, attr), setter)(*args[:-1], tr(args[-1]))
+
+    def apply_dynamic_settings(self, force=False):
         """Applies all dynamic settings through logic module."""
-        self.logic.apply_dynamic_settings(self)
+        self.logic.apply_dynamic_settings(self, force)
+
+    def schedule_dynamic_settings(self, *args):
+        """
+        Schedules apply_dynamic_settings, restarting the debounce timer on every signal.
+
+        Signals fired while init_ui sets initial values are dropped; init_ui applies once at the end.
+
+        :param args: Ignored signal arguments
+        """
+        if self._initializing:
+            return
+        self._apply_timer.start()
+
+    def flush_dynamic_settings(self):
+        """Applies a pending dynamic settings change immediately."""
+        if self._apply_timer.isActive():
+            self._apply_timer.stop()
+            self.apply_dynamic_settings()
 
     def apply_font_to_children(self, widget, font):
-        """Applies font to all child widgets recursively."""
-        self.logic.apply_font_to_children(self)
+        """Applies font to a widget; its children inherit it."""
+        self.logic.apply_font_to_children(self, widget, font)
 
     def select_text_color(self):
         """Opens color dialog to select text color."""
@@ -140,14 +212,8 @@ class TabSettings(QWidget, TabSettingsUI):
         self.settings["dark_mode"] = enable
         log_debug(f"[TabSettings] dark mode {'ON' if enable else 'OFF'}")
 
-        try:
-            ConfigManager.update_partial({"dark_mode": enable})
-        except Exception as e:
-            QMessageBox.critical(
-                self,
-                self.tr("error_set_saving_title"),
-                self.tr("error_set_saving_msg").format(e)
-            )
+        # Write failures surface through ConfigManager's own error dialog
+        ConfigManager.update_partial({"dark_mode": enable})
 
     def toggle_overlay(self):
         """
@@ -162,38 +228,34 @@ class TabSettings(QWidget, TabSettingsUI):
 
         self.settings = ConfigManager.load()
 
-        if self.overlay and self.overlay.isVisible():
-            self.overlay.close()
-            self.overlay = None
-            log_debug("[TabSettings] overlay turned OFF")
+        if self._close_overlay():
             return
 
-        screens = QApplication.screens()
-        screen_count = len(screens)
         is_fullscreen = self.settings.get("display_overlay_mode", "fullscreen") == "fullscreen"
 
         if is_fullscreen:
-            main_geom = self.get_main_geometry()
-            main_screen = QApplication.screenAt(main_geom.center())
+            target_geometry, has_other_screen = self._get_fullscreen_target()
 
-            if screen_count > 1:
-                other_screens = [s for s in screens if s != main_screen]
-                target_geometry = other_screens[0].geometry()
-            else:
-                if not QCoreApplication.instance().property("warned_display_once"):
+            if not has_other_screen:
+                if not TabSettings._warned_display_once:
                     reply = QMessageBox.question(
                         self,
                         self.tr("warning_single_display_title"),
                         self.tr("warning_single_display_msg"),
                         QMessageBox.Yes | QMessageBox.No
                     )
-                    QCoreApplication.instance().setProperty("warned_display_once", True)
+                    TabSettings._warned_display_once = True
                     if reply != QMessageBox.Yes:
                         self.overlay_denied = True
                         return
-                target_geometry = screens[0].geometry()
         else:
-            index = self.display_combo.currentIndex()
+            screens = QApplication.screens()
+            screen_count = len(screens)
+            index = (
+                self.display_combo.currentIndex()
+                if self._overlay_built else
+                self.settings.get("display_index", 0)
+            )
             target_geometry = (
                 screens[index].geometry()
                 if 0 <= index < screen_count else
@@ -204,6 +266,105 @@ class TabSettings(QWidget, TabSettingsUI):
         self.overlay.show()
         log_debug("[TabSettings] overlay turned ON")
 
+    def _get_fullscreen_target(self):
+        """
+        Returns the geometry used for a fullscreen overlay, computing it only when the cache is stale.
+
+        The overlay goes to the first screen other than the one holding the main window,
+        or to the only screen when just one is connected.
+
+        :return: (target geometry, whether a screen other than the main one exists)
+        :rtype: tuple[QRect, bool]
+        """
+        self.watch_main_window()
+
+        if self._overlay_target_cache is None:
+            screens = QApplication.screens()
+            main_screen = QApplication.screenAt(self.get_main_geometry().center())
+
+            if len(screens) > 1:
+                other_screens = [s for s in screens if s != main_screen]
+                self._overlay_target_cache = (other_screens[0].geometry(), True)
+            else:
+                self._overlay_target_cache = (screens[0].geometry(), False)
+
+        return self._overlay_target_cache
+
+    def watch_main_window(self):
+        """
+        Installs this tab as an event filter on its top-level window.
+
+        Moves and resizes invalidate the overlay placement cache; minimizing or hiding
+        the window pauses the poll timer.
+        """
+        window = self.window()
+        if window is self or window is self._watched_window:
+            return
+        if self._watched_window is not None:
+            self._watched_window.removeEventFilter(self)
+        window.installEventFilter(self)
+        self._watched_window = window
+        self._invalidate_overlay_target()
+
+    def _invalidate_overlay_target(self, *args):
+        """
+        Drops the cached fullscreen overlay geometry.
+        """
+        self._overlay_target_cache = None
+
+    def _on_screen_added(self, screen):
+        """
+        Tracks geometry changes of a newly connected screen and invalidates the cache.
+
+        :param screen: Newly added screen
+        :type screen: QScreen
+        """
+        screen.geometryChanged.connect(self._invalidate_overlay_target)
+        self._invalidate_overlay_target()
+
+    def eventFilter(self, obj, event):
+        """
+        Invalidates the overlay placement cache when the main window moves or resizes,
+        and pauses or resumes polling when it is minimized, hidden, or shown again.
+
+        :param obj: Watched object
+        :type obj: QObject
+        :param event: Incoming event
+        :type event: QEvent
+        :return: Always False so the event continues to propagate
+        :rtype: bool
+        """
+        if obj is self._watched_window:
+            etype = event.type()
+            if etype in (QEvent.Move, QEvent.Resize):
+                self._invalidate_overlay_target()
+            elif etype in (QEvent.Hide, QEvent.Show, QEvent.WindowStateChange):
+                self._set_poll_paused(obj.isMinimized() or not obj.isVisible())
+        return super().eventFilter(obj, event)
+
+    def _set_poll_paused(self, paused):
+        """
+        Stops the poll timer while the main window is minimized or hidden, and resumes it afterwards.
+
+        The file watcher stays active, so verse changes still reach the overlay without periodic wake-ups.
+
+        :param paused: True to pause polling
+        :type paused: bool
+        """
+        if paused == self._poll_paused:
+            return
+        self._poll_paused = paused
+        if not self.get_poll_enabled():
+            return
+
+        if paused:
+            self.poll_timer.stop()
+            log_debug("[TabSettings] polling paused while window is hidden")
+        else:
+            self.arm_polling(self.settings.get("poll_interval", 1000))
+            self.poll_file()
+            log_debug("[TabSettings] polling resumed")
+
     def get_main_geometry(self):
         print("get_main_geometry internally called")
         from PySide6.QtCore import QRect
@@ -227,38 +388,134 @@ class TabSettings(QWidget, TabSettingsUI):
         if not self.overlay or not self.overlay.isVisible():
             self.toggle_overlay()
 
+    def _close_overlay(self, reason=""):
+        """
+        Closes the overlay if it is currently visible.
+
+        :param reason: Optional suffix for the debug log (e.g. "due to empty verse")
+        :type reason: str
+        :return: True if an overlay was closed, False otherwise
+        :rtype: bool
+        """
+        overlay = self.overlay
+        if not overlay or not overlay.isVisible():
+            return False
+
+        overlay.close()
+        self.overlay = None
+        log_debug(f"[TabSettings] overlay turned OFF {reason}".rstrip())
+        return True
+
     def poll_file(self):
         """
         Periodically checks the verse output file and controls overlay visibility.
+
+        Only runs while polling is enabled; apply_polling_settings stops the timer otherwise.
+        The file is only read when its modification time or size changed since the last tick.
         """
-        if not self.settings.get("poll_enabled", False):
-            if self.overlay and self.overlay.isVisible():
-                self.overlay.close()
-                self.overlay = None
-                log_debug("[TabSettings] overlay turned OFF due to polling OFF")
+        try:
+            st = os.stat(self.verse_path)
+            sig = (st.st_mtime_ns, st.st_size)
+        except OSError:
+            sig = None
+
+        if sig == self._last_stat:
             return
+        self._last_stat = sig
 
+        overlay = self.overlay
         if should_show_overlay(self.verse_path):
-            if not self.overlay or not self.overlay.isVisible():
+            if not overlay or not overlay.isVisible():
                 self.ensure_overlay_on()
         else:
-            if self.overlay and self.overlay.isVisible():
-                self.overlay.close()
-                self.overlay = None
-                log_debug("[TabSettings] overlay turned OFF due to empty verse")
+            self._close_overlay("due to empty verse")
+
+    def arm_polling(self, interval, elapsed=0):
+        """
+        Watches the verse file for changes, falling back to the poll timer when it cannot be watched.
+
+        While the watcher covers the file, the timer only runs as a slow safety re-check.
+        A pending tick with the same period is left alone, and no tick is scheduled while paused.
+
+        :param interval: Fallback polling interval in milliseconds
+        :type interval: int
+        :param elapsed: Milliseconds already spent in the current tick, deducted from a fallback delay
+        :type elapsed: int
+        """
+        watched = self._watch_verse_file()
+        if watched:
+            interval = max(interval, WATCH_SAFETY_INTERVAL)
+        if self._poll_paused or (self.poll_timer.isActive() and interval == self._poll_period):
+            return
+        self._poll_period = interval
+        self.poll_timer.setTimerType(get_poll_timer_type(interval, watched))
+        if watched:
+            # Safety re-checks are rounded to whole seconds by Qt; there is no drift worth compensating
+            self.poll_timer.start(interval)
+            self._poll_due = None
+            return
+        delay = max(0, interval - elapsed)
+        self.poll_timer.start(delay)
+        self._poll_due = time.monotonic() + delay / 1000
+
+    def disarm_polling(self):
+        """
+        Stops both the file watcher and the fallback poll timer.
+        """
+        self.poll_timer.stop()
+        files = self.poll_watcher.files()
+        if files:
+            self.poll_watcher.removePaths(files)
+
+    def _watch_verse_file(self):
+        """
+        Adds the verse file to the watcher if needed.
+
+        :return: True if the verse file is being watched
+        :rtype: bool
+        """
+        if self.verse_path in self.poll_watcher.files():
+            return True
+        return os.path.exists(self.verse_path) and self.poll_watcher.addPath(self.verse_path)
+
+    def _on_verse_file_changed(self, path):
+        """
+        Handles a change notification for the verse file.
+
+        Atomic writes replace the file, which drops it from the watcher, so the watch is re-armed first.
+
+        :param path: Path of the changed file
+        :type path: str
+        """
+        self.arm_polling(self.settings.get("poll_interval", 1000))
+        self.poll_file()
+
+    def _on_poll_timer(self):
+        """
+        Timer tick: polls the file and re-arms the watcher, slowing the timer once it is watched.
+
+        Fallback ticks are scheduled relative to when this one started, so the time spent
+        polling does not accumulate as drift; their lateness is logged every 100 ticks.
+        """
+        started = time.monotonic()
+        if self._poll_due is not None:
+            self._poll_ticks += 1
+            if self._poll_ticks % 100 == 0:
+                log_debug(f"[TabSettings] poll timer drift {(started - self._poll_due) * 1000:.1f} ms")
+
+        self.poll_file()
+        elapsed = int((time.monotonic() - started) * 1000)
+        self.arm_polling(self.settings.get("poll_interval", 1000), elapsed)
 
     def update_presentation_visibility(self):
         """
         Shows or hides the overlay configuration group based on polling or always-show setting.
         """
 
-        self.settings["always_show_on_off_buttons"] = self.always_on_off_checkbox.isChecked()
-
-        always_on = self.settings.get("always_show_on_off_buttons", False)
-        poll_enabled = self.get_poll_enabled()
-        effective_polling = poll_enabled or always_on
+        always_on = self.always_on_off_checkbox.isChecked()
+        self.settings["always_show_on_off_buttons"] = always_on
 
-        if effective_polling:
+        if always_on or self.get_poll_enabled():
             self.overlay_group.show()
         else:
-            self.overlay_group.hide()
\ No newline at end of file
+            self.overlay_group.hide()
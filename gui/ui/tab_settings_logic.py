@@ -12,17 +12,43 @@ Copyright (c) 2025 The Eulji-ro Presbyterian Church.
 License: MIT License with Attribution Requirement (see LICENSE file for details)
 """
 
-from PySide6.QtWidgets import QWidget, QMessageBox
+from PySide6.QtCore import Qt
+from PySide6.QtGui import QColor
+from PySide6.QtWidgets import QColorDialog
 
-from core.utils.input_validators import validate_int
 from core.utils.logger import log_debug
 
 from gui.config.config_manager import ConfigManager
-from gui.constants import messages
 
 from gui.utils.settings_helper import update_overlay_settings
-from gui.utils.utils_fonts import apply_main_font_to_app, apply_overlay_font
-from gui.utils.utils_dialog import get_save_path, set_color_from_dialog
+from gui.utils.utils_fonts import apply_font_to_children, apply_main_font_to_app, apply_overlay_font
+from gui.utils.utils_dialog import get_save_path, apply_picked_color
+
+# Slowest safety poll while the file watcher is active (catches missed notifications)
+WATCH_SAFETY_INTERVAL = 5000
+
+def get_poll_timer_type(interval, safety_check=False):
+    """
+    Returns the loosest timer type acceptable for the given polling interval.
+
+    Polling the verse file tolerates some slack: coarse timers let the OS batch
+    wake-ups with other timers instead of waking the event loop with 1 ms accuracy.
+    Only the watcher's safety re-check accepts full-second rounding (VeryCoarseTimer);
+    the user's fallback interval keeps its millisecond value with CoarseTimer's 5% slack.
+    Below 100 ms that slack would bunch ticks together, so those use PreciseTimer.
+
+    :param interval: Polling interval in milliseconds
+    :type interval: int
+    :param safety_check: True when the file watcher is active and the timer only re-checks
+    :type safety_check: bool
+    :return: Qt timer type for the poll timer
+    :rtype: Qt.TimerType
+    """
+    if safety_check:
+        return Qt.VeryCoarseTimer
+    if interval >= 100:
+        return Qt.CoarseTimer
+    return Qt.PreciseTimer
 
 class TabSettingsLogic:
     """
@@ -51,52 +77,86 @@ class TabSettingsLogic:
         self.tr = tr_func
         self.refresh_settings_callback = refresh_settings_callback
 
-    def apply_dynamic_settings(self, parent):
+        # Widget state snapshot of the last apply_dynamic_settings run
+        self._last_state = None
+
+        # Color dialogs are kept per setting key and reused on later picks
+        self._color_dialogs = {}
+
+    def apply_dynamic_settings(self, parent, force=False):
         """
         Apply font, overlay, and display settings to the application.
 
+        Skipped when the widget state matches the last applied snapshot, unless forced.
+
         :param parent: Reference to the TabSettings instance (contains UI state)
         :type parent: QWidget
+        :param force: Apply even if nothing changed since the last call
+        :type force: bool
         """
-        if not hasattr(parent, "display_font_size_combo"):
+        if not hasattr(parent, "always_on_off_checkbox"):
             return
 
-        # Apply font to all widgets in the app
-        apply_main_font_to_app(
+        # Overlay widgets only exist once the overlay group has been expanded
+        overlay_built = parent._overlay_built
+        state = (
             parent.font_family_combo.currentText(),
-            int(parent.font_size_combo.currentText()),
+            parent.font_size_combo.currentText(),
             parent.font_weight_combo.currentData(),
-            parent.window()
+            parent.always_on_off_checkbox.isChecked(),
+            (
+                parent.display_font_family_combo.currentText(),
+                parent.display_font_size_combo.currentText(),
+                parent.display_font_weight_combo.currentData(),
+                parent.alpha_slider.value(),
+                parent.text_color_btn.color_hex,
+                parent.bg_color_btn.color_hex,
+                parent.overlay_mode_combo.currentIndex(),
+            ) if overlay_built else None,
         )
+        if not force and state == self._last_state:
+            return
 
-        # Collect current overlay settings from UI and update
-        updated_overlay = update_overlay_settings(parent.settings, {
-            "font_family_combo": parent.display_font_family_combo,
-            "font_size_combo": parent.display_font_size_combo,
-            "font_weight_combo": parent.display_font_weight_combo,
-            "alpha_slider": parent.alpha_slider,
-            "text_color_btn": parent.text_color_btn,
-            "bg_color_btn": parent.bg_color_btn,
-            "mode_combo": parent.overlay_mode_combo
-        })
-        ConfigManager.update_partial(updated_overlay)
-
-        # Save on/off visibility setting
-        always_show_on_off = parent.always_on_off_checkbox.isChecked()
-        ConfigManager.update_partial({"always_show_on_off_buttons": always_show_on_off})
-        parent.settings["always_show_on_off_buttons"] = always_show_on_off
-
-        # Apply overlay font if overlay is active
-        if parent.overlay:
-            apply_overlay_font(parent.overlay, parent.settings)
-
-        # Reload all tabs with new settings
-        if self.refresh_settings_callback:
-            self.refresh_settings_callback()
+        # Font, overlay, and refresh writes below are flushed to disk once
+        with ConfigManager.batched():
+            # Apply font to all widgets in the app
+            apply_main_font_to_app(
+                parent.font_family_combo.currentText(),
+                int(parent.font_size_combo.currentText()),
+                parent.font_weight_combo.currentData(),
+                parent.window()
+            )
+
+            # Collect current overlay settings from UI and update
+            updated_overlay = update_overlay_settings(parent.settings, {
+                "font_family_combo": parent.display_font_family_combo,
+                "font_size_combo": parent.display_font_size_combo,
+                "font_weight_combo": parent.display_font_weight_combo,
+                "alpha_slider": parent.alpha_slider,
+                "text_color_btn": parent.text_color_btn,
+                "bg_color_btn": parent.bg_color_btn,
+                "mode_combo": parent.overlay_mode_combo
+            }) if overlay_built else {}
+
+            # Save overlay and on/off visibility settings in one update
+            always_show_on_off = parent.always_on_off_checkbox.isChecked()
+            updated = {**updated_overlay, "always_show_on_off_buttons": always_show_on_off}
+            ConfigManager.update_partial(updated)
+            parent.settings["always_show_on_off_buttons"] = always_show_on_off
+
+            # Apply overlay font if overlay is active
+            if parent.overlay:
+                apply_overlay_font(parent.overlay, parent.settings)
+
+            # Sync the main window; it only rebuilds tab buttons if their visibility changed
+            if self.refresh_settings_callback:
+                self.refresh_settings_callback(None if force else updated)
+
+        self._last_state = state
 
     def apply_font_to_children(self, parent, widget, font):
         """
-        Recursively apply a font to a widget and its children.
+        Apply a font to a widget; children without an explicit font inherit it from Qt.
 
         :param parent: Root window
         :type parent: QWidget
@@ -105,9 +165,7 @@ class TabSettingsLogic:
         :param font: QFont instance
         :type font: QFont
         """
-        widget.setFont(font)
-        for child in widget.findChildren(QWidget):
-            child.setFont(font)
+        apply_font_to_children(widget, font)
 
     def select_output_path(self, parent):
         """
@@ -132,7 +190,7 @@ class TabSettingsLogic:
         :param parent: TabSettings instance
         :type parent: QWidget
         """
-        set_color_from_dialog(parent.text_color_btn, "display_text_color", parent.apply_dynamic_settings)
+        self._open_color_dialog(parent, parent.text_color_btn, "display_text_color")
 
     def select_bg_color(self, parent):
         """
@@ -143,32 +201,51 @@ class TabSettingsLogic:
         :param parent: TabSettings instance
         :type parent: QWidget
         """
-        set_color_from_dialog(parent.bg_color_btn, "display_bg_color", parent.apply_dynamic_settings)
+        self._open_color_dialog(parent, parent.bg_color_btn, "display_bg_color")
+
+    def _open_color_dialog(self, parent, button, setting_key):
+        """
+        Open the persistent color dialog for a setting without blocking the event loop.
+
+        The dialog is created on first use and reused afterwards; the chosen color is
+        applied when the dialog reports colorSelected.
+
+        :param parent: TabSettings instance
+        :type parent: QWidget
+        :param button: Color preview button tied to the setting
+        :type button: QPushButton
+        :param setting_key: Settings key the color is saved under
+        :type setting_key: str
+        """
+        dialog = self._color_dialogs.get(setting_key)
+        if dialog is None:
+            dialog = QColorDialog(parent)
+            dialog.setOption(QColorDialog.DontUseNativeDialog, True)
+            dialog.colorSelected.connect(
+                lambda color: apply_picked_color(color, button, setting_key, parent.apply_dynamic_settings)
+            )
+            self._color_dialogs[setting_key] = dialog
+
+        dialog.setCurrentColor(QColor(button.color_hex))
+        dialog.open()
 
     def save_poll_interval(self, parent):
         """
         Save the polling interval from the input box.
 
-        If the value is not a valid integer, show a warning dialog.
+        The input carries a QIntValidator, so anything it does not accept (e.g. an empty field)
+        is ignored and the remaining text always parses.
 
         :param parent: TabSettings instance
         :type parent: QWidget
         """
-        text = parent.poll_input.text()
-
-        # Check validity of interval value
-        valid, interval = validate_int(text)
-        if not valid:
-            QMessageBox.warning(
-                parent,
-                messages.ERROR_MESSAGES["POLL_INTERVAL_INVALID_TITLE"],
-                messages.ERROR_MESSAGES["POLL_INTERVAL_INVALID_MSG"]
-            )
+        if not parent.poll_input.hasAcceptableInput():
             return
+        interval = int(parent.poll_input.text())
 
         # Save the valid interval to disk and memory
         parent.settings["poll_interval"] = interval
-        ConfigManager.save(self.settings)
+        ConfigManager.update_partial({"poll_interval": interval})
         log_debug(f"Saved poll interval: {interval}")
 
     def apply_polling_settings(self, parent):
@@ -182,18 +259,16 @@ class TabSettingsLogic:
         poll_interval = parent.settings.get("poll_interval", 1000)
 
         if poll_enabled:
-            if parent.poll_timer.isActive():
-                parent.poll_timer.stop()
-            parent.poll_timer.start(poll_interval)
+            # arm_polling keeps a pending tick when the period is unchanged instead of restarting it
+            parent.arm_polling(poll_interval)
             log_debug("[TabSettings] polling restarted")
+
+            # Forget the last file signature so the first poll re-evaluates the overlay
+            parent._last_stat = (0, 0)
             parent.poll_file()
         else:
-            if parent.poll_timer.isActive():
-                parent.poll_timer.stop()
+            parent.disarm_polling()
             log_debug("[TabSettings] polling stopped")
 
             # If overlay is active, close it when polling is turned off
-            if parent.overlay and parent.overlay.isVisible():
-                parent.overlay.close()
-                parent.overlay = None
-                log_debug("[TabSettings] overlay turned OFF due to polling OFF")
\ No newline at end of file
+            parent._close_overlay("due to polling OFF")
\ No newline at end of file
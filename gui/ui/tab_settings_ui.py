@@ -12,17 +12,92 @@ Copyright (c) 2025 The Eulji-ro Presbyterian Church.
 License: MIT License with Attribution Requirement (see LICENSE file for details)
 """
 
-import qdarkstyle
 import platform
 
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QTimer
 from PySide6.QtWidgets import (
     QVBoxLayout, QHBoxLayout, QLabel, QComboBox, QCheckBox, QGroupBox,
-    QLineEdit, QSlider, QPushButton, QFontComboBox
+    QLineEdit, QSlider, QPushButton, QWidget
 )
-from PySide6.QtGui import QFont
+from PySide6.QtGui import QFont, QIntValidator
+
+from gui.ui.common import create_button, create_svg_text_button, set_button_color, LazyFontComboBox
+from gui.utils.utils_theme import set_dark_mode
+
+# macOS offers a fixed pair of system fonts instead of the full font list
+_IS_DARWIN = platform.system() == "Darwin"
+_MAC_FONTS = ("Apple SD Gothic Neo", "Helvetica Neue")
+
+# Font size choices for the main font and the overlay font
+_MAIN_SIZES = tuple(range(6, 49, 2))
+_MAIN_SIZE_INDEX = {size: idx for idx, size in enumerate(_MAIN_SIZES)}
+_MAIN_SIZE_LABELS = tuple(str(size) for size in _MAIN_SIZES)
+_OVERLAY_SIZES = (12, 14, 18, 24, 30, 36, 48, 60, 72, 96)
+_OVERLAY_SIZE_INDEX = {size: idx for idx, size in enumerate(_OVERLAY_SIZES)}
+_OVERLAY_SIZE_LABELS = tuple(str(size) for size in _OVERLAY_SIZES)
+
+# Font weight choices shared by the main and overlay weight combos
+_WEIGHTS = (
+    ("Thin", QFont.Weight.Thin), ("ExtraLight", QFont.Weight.ExtraLight),
+    ("Light", QFont.Weight.Light), ("Normal", QFont.Weight.Normal),
+    ("Medium", QFont.Weight.Medium), ("DemiBold", QFont.Weight.DemiBold),
+    ("Bold", QFont.Weight.Bold), ("ExtraBold", QFont.Weight.ExtraBold),
+    ("Black", QFont.Weight.Black)
+)
+_WEIGHT_INDEX = {weight.value: idx for idx, (_, weight) in enumerate(_WEIGHTS)}
+_NORMAL_WEIGHT_INDEX = _WEIGHT_INDEX[QFont.Weight.Normal.value]
+
+
+def _make_font_combo(default_family):
+    """
+    Creates the font family selector for the current platform with the given family selected.
+
+    :param default_family: Family to select initially
+    :type default_family: str
+    :return: Font family combo box
+    :rtype: QComboBox
+    """
+    if _IS_DARWIN:
+        combo = QComboBox()
+        combo.addItems(_MAC_FONTS)
+    else:
+        combo = LazyFontComboBox()
+    combo.setCurrentText(default_family)
+    return combo
 
-from gui.ui.common import create_button, create_svg_text_button
+
+def _make_size_combo(labels, index_map, size):
+    """
+    Creates a font size selector with the given size selected, or the first entry if it is not offered.
+
+    :param labels: Size labels to list
+    :type labels: tuple[str]
+    :param index_map: Mapping from size to its position in labels
+    :type index_map: dict[int, int]
+    :param size: Size to select initially
+    :type size: int
+    :return: Font size combo box
+    :rtype: QComboBox
+    """
+    combo = QComboBox()
+    combo.addItems(labels)
+    combo.setCurrentIndex(index_map.get(size, 0))
+    return combo
+
+
+def _populate_weight_combo(combo, saved_weight):
+    """
+    Fills a combo box with the font weight choices and selects the saved weight.
+
+    :param combo: Combo box to fill
+    :type combo: QComboBox
+    :param saved_weight: Saved weight as QFont.Weight or its integer value
+    :type saved_weight: QFont.Weight or int
+    """
+    for label, weight in _WEIGHTS:
+        combo.addItem(label, weight)
+    # Unknown weights (e.g. legacy Qt5 values) fall back to Normal rather than Thin
+    combo.setCurrentIndex(_WEIGHT_INDEX.get(getattr(saved_weight, "value", saved_weight), _NORMAL_WEIGHT_INDEX))
 
 
 class TabSettingsUI:
@@ -38,81 +113,66 @@ class TabSettingsUI:
         This method constructs all font-related configuration widgets, theme toggles,
         overlay settings, output paths, and polling controls.
         """
+        # Look up each translated string once
+        tr = self.tr
+        label_family = tr("label_font_family")
+        label_size = tr("label_font_size")
+        label_weight = tr("label_font_weight")
+
+        # Change signals emitted while the defaults are being set are ignored
+        self._initializing = True
+
+        # Suspend painting while the groups are assembled; layouts stay detached until the end
+        self.setUpdatesEnabled(False)
+
+        # Coalesces bursts of change signals (slider drags, combo scrolling) into one apply
+        self._apply_timer = QTimer(self)
+        self._apply_timer.setSingleShot(True)
+        self._apply_timer.setInterval(100)
+        self._apply_timer.timeout.connect(self.apply_dynamic_settings)
+
         # --------------------------
         # Main Group: App Font and Theme
         # --------------------------
 
         self.main_group = QGroupBox()
-        self.main_group.setTitle(self.tr("setting_main_title"))
+        self.main_group.setTitle(tr("setting_main_title"))
         main_layout = QVBoxLayout()
 
         # Label and combo for font family
-        self.font_family_label = QLabel(self.tr("label_font_family"))
+        self.font_family_label = QLabel(label_family)
         self.font_family_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
 
         # OS-specific font selection
         current_font = self.app.font()
-        current_family = current_font.family()
-        if platform.system() == "Darwin":
-            self.font_family_combo = QComboBox()
-            self.font_family_combo.addItems(["Apple SD Gothic Neo", "Helvetica Neue"])
-        else:
-            self.font_family_combo = QFontComboBox()
-            self.font_family_combo.setFontFilters(QFontComboBox.FontFilter.ScalableFonts)
-        current_family = self.settings.get("font_family", "Arial")
-
-        # Set default font
-        if isinstance(self.font_family_combo, QComboBox):
-            self.font_family_combo.setCurrentText(current_family)
-            self.font_family_combo.currentTextChanged.connect(self.apply_dynamic_settings)
-        else:
-            self.font_family_combo.setCurrentFont(QFont(current_family))
-            self.font_family_combo.currentFontChanged.connect(self.apply_dynamic_settings)
+        self.font_family_combo = _make_font_combo(self.settings.get("font_family", "Arial"))
+        self.font_family_combo.currentTextChanged.connect(self.schedule_dynamic_settings)
 
         # Font size selection
-        self.font_size_label = QLabel(self.tr("label_font_size"))
+        self.font_size_label = QLabel(label_size)
         self.font_size_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         current_size = current_font.pointSize()
-        self.font_size_combo = QComboBox()
-        for size in range(6, 49, 2):
-            self.font_size_combo.addItem(str(size))
-        self.font_size_combo.setCurrentText(str(current_size))
-        self.font_size_combo.currentIndexChanged.connect(self.apply_dynamic_settings)
+        self.font_size_combo = _make_size_combo(_MAIN_SIZE_LABELS, _MAIN_SIZE_INDEX, current_size)
+        self.font_size_combo.currentIndexChanged.connect(self.schedule_dynamic_settings)
 
         # Font weight selection
-        self.font_weight_label = QLabel(self.tr("label_font_weight"))
+        self.font_weight_label = QLabel(label_weight)
         self.font_weight_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.font_weight_combo = QComboBox()
-        for label, weight in [
-            ("Thin", QFont.Weight.Thin), ("ExtraLight", QFont.Weight.ExtraLight),
-            ("Light", QFont.Weight.Light), ("Normal", QFont.Weight.Normal),
-            ("Medium", QFont.Weight.Medium), ("DemiBold", QFont.Weight.DemiBold),
-            ("Bold", QFont.Weight.Bold), ("ExtraBold", QFont.Weight.ExtraBold),
-            ("Black", QFont.Weight.Black)
-        ]:
-            self.font_weight_combo.addItem(label, weight)
-        current_weight = self.settings.get("font_weight", current_font.weight())
-        qt_weight = QFont.Weight(current_weight)
-        for idx in range(self.font_weight_combo.count()):
-            if self.font_weight_combo.itemData(idx).value == qt_weight.value:
-                self.font_weight_combo.setCurrentIndex(idx)
-                break
-        self.font_weight_combo.currentIndexChanged.connect(self.apply_dynamic_settings)
+        _populate_weight_combo(self.font_weight_combo, self.settings.get("font_weight", current_font.weight()))
+        self.font_weight_combo.currentIndexChanged.connect(self.schedule_dynamic_settings)
 
         # Theme toggle button
         self.theme_toggle_btn = create_svg_text_button(
             "resources/svg/btn_theme_toggle.svg",
-            self.tr("btn_theme_toggle"),
+            tr("btn_theme_toggle"),
             30,
             "Toggle Light/Dark Theme",
             self.toggle_theme
         )
 
-        # Apply theme immediately
-        if self.settings.get("dark_mode"):
-            self.app.setStyleSheet(qdarkstyle.load_stylesheet_pyside6())
-        else:
-            self.app.setStyleSheet("")
+        # Apply theme immediately (no-op when launch already applied it)
+        set_dark_mode(self.app, bool(self.settings.get("dark_mode")))
 
         # Assemble font layout
         main_fonts = QHBoxLayout()
@@ -129,20 +189,68 @@ class TabSettingsUI:
         main_layout.addLayout(dark_toggle)
 
         # Checkbox for on/off button visibility
-        self.always_on_off_checkbox = QCheckBox(self.tr("checkbox_show_on_off"))
+        self.always_on_off_checkbox = QCheckBox(tr("checkbox_show_on_off"))
         self.always_on_off_checkbox.setChecked(self.settings.get("always_show_on_off_buttons", False))
-        self.always_on_off_checkbox.stateChanged.connect(self.apply_dynamic_settings)
+        self.always_on_off_checkbox.stateChanged.connect(self.schedule_dynamic_settings)
         main_layout.addWidget(self.always_on_off_checkbox)
 
         main_layout.addStretch()
         self.main_group.setLayout(main_layout)
 
         # --------------------------
-        # Overlay Group: Slide Display Options
+        # Overlay Group: Slide Display Options (lazy)
         # --------------------------
 
+        # Built on first expand by _build_overlay_group; collapsed until then
         self.overlay_group = QGroupBox()
-        self.overlay_group.setTitle(self.tr("setting_overlay_title"))
+        self.overlay_group.setTitle(tr("setting_overlay_title"))
+        self.overlay_group.setCheckable(True)
+        self.overlay_group.setChecked(False)
+        self.overlay_group.setLayout(QVBoxLayout())
+        self._overlay_built = False
+        self._overlay_content = None
+        self.overlay_group.toggled.connect(self._on_overlay_group_toggled)
+
+        # Final layout
+        layout = QVBoxLayout()
+        layout.addWidget(self.main_group)
+        layout.addWidget(self.overlay_group)
+        self.setLayout(layout)
+
+        self.main_layout = main_layout
+        self.setUpdatesEnabled(True)
+
+        # Apply immediately on load, exactly once
+        self.apply_dynamic_settings()
+        self._initializing = False
+
+    def _on_overlay_group_toggled(self, expanded):
+        """
+        Expands or collapses the overlay group, building its widgets on the first expand.
+
+        :param expanded: True when the group's checkbox was checked
+        :type expanded: bool
+        """
+        if expanded and not self._overlay_built:
+            self._build_overlay_group()
+        if self._overlay_content is not None:
+            self._overlay_content.setVisible(expanded)
+
+    def _build_overlay_group(self):
+        """
+        Builds the overlay settings widgets: output display, overlay font and colors,
+        output path, overlay mode, and polling interval.
+
+        Called once, when the overlay group is first expanded.
+        """
+        tr = self.tr
+        label_family = tr("label_font_family")
+        label_size = tr("label_font_size")
+        label_weight = tr("label_font_weight")
+
+        # Initial values below must not schedule an apply
+        initializing, self._initializing = self._initializing, True
+
         overlay_layout = QVBoxLayout()
 
         # Display output screen
@@ -157,97 +265,73 @@ class TabSettingsUI:
 
         # Font for overlay text
         display_font_layout = QHBoxLayout()
-        self.display_font_family_label = QLabel(self.tr("label_font_family"))
+        self.display_font_family_label = QLabel(label_family)
         display_font_layout.addWidget(self.display_font_family_label)
 
-        if platform.system() == "Darwin":
-            self.display_font_family_combo = QComboBox()
-            self.display_font_family_combo.addItems(["Apple SD Gothic Neo", "Helvetica Neue"])
-        else:
-            self.display_font_family_combo = QFontComboBox()
-            self.display_font_family_combo.setFontFilters(QFontComboBox.FontFilter.ScalableFonts)
-
-        display_family = self.settings.get("display_font_family", "Arial")
-        if isinstance(self.display_font_family_combo, QComboBox):
-            self.display_font_family_combo.setCurrentText(display_family)
-            self.display_font_family_combo.currentTextChanged.connect(self.apply_dynamic_settings)
-        else:
-            self.display_font_family_combo.setCurrentFont(QFont(display_family))
-            self.display_font_family_combo.currentTextChanged.connect(self.apply_dynamic_settings)
+        self.display_font_family_combo = _make_font_combo(self.settings.get("display_font_family", "Arial"))
+        self.display_font_family_combo.currentTextChanged.connect(self.schedule_dynamic_settings)
 
         display_font_layout.addWidget(self.display_font_family_combo)
         display_font_layout.addStretch()
 
         # Font size for overlay
-        self.display_font_size_label = QLabel(self.tr("label_font_size"))
+        self.display_font_size_label = QLabel(label_size)
         display_font_layout.addWidget(self.display_font_size_label)
 
-        self.display_font_size_combo = QComboBox()
-        font_sizes = [str(size) for size in [12, 14, 18, 24, 30, 36, 48, 60, 72, 96]]
-        self.display_font_size_combo.addItems(font_sizes)
-        size_index = self.display_font_size_combo.findText(str(self.settings.get("display_font_size", 36)))
-        if size_index >= 0:
-            self.display_font_size_combo.setCurrentIndex(size_index)
-        self.display_font_size_combo.currentIndexChanged.connect(self.apply_dynamic_settings)
+        self.display_font_size_combo = _make_size_combo(
+            _OVERLAY_SIZE_LABELS, _OVERLAY_SIZE_INDEX, int(self.settings.get("display_font_size", 36))
+        )
+        self.display_font_size_combo.currentIndexChanged.connect(self.schedule_dynamic_settings)
         display_font_layout.addWidget(self.display_font_size_combo)
 
         # Font weight and color for overlay
-        self.display_font_weight_label = QLabel(self.tr("label_font_weight"))
+        self.display_font_weight_label = QLabel(label_weight)
         self.display_font_weight_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.display_font_weight_combo = QComboBox()
-        for label, weight in [
-            ("Thin", QFont.Weight.Thin), ("ExtraLight", QFont.Weight.ExtraLight),
-            ("Light", QFont.Weight.Light), ("Normal", QFont.Weight.Normal),
-            ("Medium", QFont.Weight.Medium), ("DemiBold", QFont.Weight.DemiBold),
-            ("Bold", QFont.Weight.Bold), ("ExtraBold", QFont.Weight.ExtraBold),
-            ("Black", QFont.Weight.Black)
-        ]:
-            self.display_font_weight_combo.addItem(label, weight)
-        saved_weight = self.settings.get("display_font_weight", QFont.Weight.Normal.value)
-        for idx in range(self.display_font_weight_combo.count()):
-            if self.display_font_weight_combo.itemData(idx).value == saved_weight:
-                self.display_font_weight_combo.setCurrentIndex(idx)
-                break
-        self.display_font_weight_combo.currentIndexChanged.connect(self.apply_dynamic_settings)
+        _populate_weight_combo(
+            self.display_font_weight_combo, self.settings.get("display_font_weight", QFont.Weight.Normal.value)
+        )
+        self.display_font_weight_combo.currentIndexChanged.connect(self.schedule_dynamic_settings)
         display_font_layout.addWidget(self.display_font_weight_label)
         display_font_layout.addWidget(self.display_font_weight_combo)
 
         # Text color button
-        self.display_font_color_label = QLabel(self.tr("label_display_font_color"))
+        self.display_font_color_label = QLabel(tr("label_display_font_color"))
         display_font_layout.addWidget(self.display_font_color_label)
         self.text_color_btn = create_button("")
-        self.text_color_btn.setStyleSheet(f"background-color: {self.settings.get('display_text_color', '#000000')}")
+        set_button_color(self.text_color_btn, self.settings.get("display_text_color", "#000000"))
         self.text_color_btn.clicked.connect(self.select_text_color)
         display_font_layout.addWidget(self.text_color_btn)
         overlay_layout.addLayout(display_font_layout)
 
         # Background alpha and color
         bg_layout = QHBoxLayout()
-        self.bg_alpha_label = QLabel(self.tr("label_display_bg_alpha"))
+        self.bg_alpha_label = QLabel(tr("label_display_bg_alpha"))
         bg_layout.addWidget(self.bg_alpha_label)
 
         self.alpha_slider = QSlider(Qt.Horizontal)
         self.alpha_slider.setRange(0, 100)
         self.alpha_slider.setValue(int(self.settings.get("display_bg_alpha", 0.85) * 100))
-        self.alpha_slider.valueChanged.connect(self.apply_dynamic_settings)
+        self.alpha_slider.valueChanged.connect(self.schedule_dynamic_settings)
+        self.alpha_slider.sliderReleased.connect(self.flush_dynamic_settings)
         bg_layout.addWidget(self.alpha_slider)
 
-        self.bg_color_label = QLabel(self.tr("label_display_bg_color"))
+        self.bg_color_label = QLabel(tr("label_display_bg_color"))
         bg_layout.addWidget(self.bg_color_label)
         self.bg_color_btn = create_button("")
-        self.bg_color_btn.setStyleSheet(f"background-color: {self.settings.get('display_bg_color', '#FFFFFF')}")
+        set_button_color(self.bg_color_btn, self.settings.get("display_bg_color", "#FFFFFF"))
         self.bg_color_btn.clicked.connect(self.select_bg_color)
         bg_layout.addWidget(self.bg_color_btn)
         overlay_layout.addLayout(bg_layout)
 
         # Output path selector
         path_layout = QHBoxLayout()
-        self.path_label = QLabel(self.tr("label_path"))
+        self.path_label = QLabel(tr("label_path"))
         path_layout.addWidget(self.path_label)
         self.output_edit = QLineEdit(self.verse_path)
         path_layout.addWidget(self.output_edit)
         self.browse_btn = create_svg_text_button(
-            "resources/svg/btn_browse.svg", self.tr("btn_browse"), 30, "Browse location", self.select_output_path
+            "resources/svg/btn_browse.svg", tr("btn_browse"), 30, "Browse location", self.select_output_path
         )
         path_layout.addWidget(self.browse_btn)
         overlay_layout.addLayout(path_layout)
@@ -255,34 +339,30 @@ class TabSettingsUI:
         # Overlay mode and polling interval
         poll_layout = QHBoxLayout()
         self.overlay_mode_combo = QComboBox()
-        self.overlay_mode_combo.addItems([self.tr("fullscreen"), self.tr("resizable")])
+        self.overlay_mode_combo.addItems([tr("fullscreen"), tr("resizable")])
         mode = self.settings.get("display_overlay_mode", "fullscreen")
         self.overlay_mode_combo.setCurrentIndex(0 if mode == "fullscreen" else 1)
-        self.overlay_mode_combo.currentIndexChanged.connect(self.apply_dynamic_settings)
+        self.overlay_mode_combo.currentIndexChanged.connect(self.schedule_dynamic_settings)
         poll_layout.addWidget(self.overlay_mode_combo)
 
         poll_layout.addStretch()
-        self.poll_label = QLabel(self.tr("label_poll_interval"))
+        self.poll_label = QLabel(tr("label_poll_interval"))
         poll_layout.addWidget(self.poll_label)
 
         self.poll_input = QLineEdit(str(self.settings.get("poll_interval", 1000)))
+        self.poll_input.setValidator(QIntValidator(1, 3600000, self.poll_input))
         self.poll_input.setFixedHeight(self.overlay_mode_combo.sizeHint().height())
         poll_layout.addWidget(self.poll_input)
 
-        self.poll_save = QPushButton(self.tr("btn_poll_interval_save"))
+        self.poll_save = QPushButton(tr("btn_poll_interval_save"))
         self.poll_save.clicked.connect(self.save_poll_interval)
         poll_layout.addWidget(self.poll_save)
         overlay_layout.addLayout(poll_layout)
 
-        # Final layout
-        self.overlay_group.setLayout(overlay_layout)
-        layout = QVBoxLayout()
-        layout.addWidget(self.main_group)
-        layout.addWidget(self.overlay_group)
-        self.setLayout(layout)
-
-        self.main_layout = main_layout
+        self._overlay_content = QWidget()
+        self._overlay_content.setLayout(overlay_layout)
+        self.overlay_group.layout().addWidget(self._overlay_content)
         self.overlay_layout = overlay_layout
 
-        # Apply immediately on load
-        self.apply_dynamic_settings()
\ No newline at end of file
+        self._overlay_built = True
+        self._initializing = initializing
@@ -13,10 +13,13 @@ License: MIT License with Attribution Requirement (see LICENSE file for details)
 """
 
 import traceback
+from functools import cached_property
+from PySide6.QtCore import QTimer
 from PySide6.QtWidgets import QWidget, QMessageBox, QGridLayout
 
+from core.logic.verse_logic import resolve_reference
 from core.utils.bible_data_loader import BibleDataLoader
-from core.utils.utils_output import save_to_files
+from core.utils.utils_output import save_to_files_async
 from core.utils.verse_version_helper import VerseVersionHelper
 from gui.ui.locale.message_loader import load_messages
 from gui.ui.tab_verse_logic import TabVerseLogic
@@ -31,6 +34,19 @@ class TabVerse(QWidget, TabVerseUI):
     Provides display, navigation, and save functionality for selected verses.
     """
 
+    # (widget attribute, setter, message key) for every static label in the tab
+    _LANG_SPEC = (
+        ("book_label", "setText", "label_book"),
+        ("chapter_label", "setText", "label_chapter"),
+        ("verse_label", "setText", "label_verse"),
+        ("verse_input", "setPlaceholderText", "verse_input_hint"),
+        ("prev_verse_btn", "setText", "btn_prev"),
+        ("search_btn", "setText", "btn_search"),
+        ("save_btn", "setText", "btn_output"),
+        ("next_verse_btn", "setText", "btn_next"),
+        ("clear_display_btn", "setText", "btn_clear"),
+    )
+
     def __init__(self, version_list, settings, tr, get_polling_status=None, get_always_show_setting=None):
         """
         Initialize the TabVerse.
@@ -47,31 +63,59 @@ class TabVerse(QWidget, TabVerseUI):
         self.initializing = False
         self.settings = settings
         self.formatted_verse_text = ""
+        self._last_effective_polling = None  # Output button visibility last applied
+        self.alias_toggle_btn = None  # Created by init_ui
+        self._enter_actions = (self._enter_search, self._enter_save)  # Indexed by "verse on display"
 
         self.get_polling_status = get_polling_status or self.get_polling_status
         self.get_always_show_setting = get_always_show_setting or self.get_always_show_setting
 
         # Load Bible data and UI components
-        self.bible_data = BibleDataLoader()
+        self.bible_data = BibleDataLoader.shared()
         self.version_layout = QGridLayout()
         self.version_helper = VerseVersionHelper(self.bible_data, self.version_layout)
         self.selection_manager = TabVerseSelectionManager(self.bible_data, self.version_helper, self.tr)
 
-        self.version_list = version_list
-        self.init_ui(version_list)
+        # Coalesces a burst of resize events (window drag) into one grid relayout
+        self._resize_timer = QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(50)
+        self._resize_timer.timeout.connect(lambda: self.selection_manager.update_grid_layout(self))
+
+        # Sort once up front so the checkbox grid is built in display order
+        self.version_list = self.version_helper.sort_versions(version_list)
+        self.init_ui(self.version_list)
 
         # Re-assign layout after UI build
         self.version_helper.version_layout = self.version_layout
+        self.version_helper.invalidate_selection()
 
-        # Sort versions and assign logic handlers
-        self.version_list = self.version_helper.sort_versions(version_list)
-        self.output_handler = VerseOutputHandler(self.display_box, self.settings)
+        # Logic handlers are created on first use (see logic / output_handler)
         self.current_language = settings.get("last_language", "ko")
-        self.logic = TabVerseLogic(self.bible_data, self.tr, self.settings, self.current_language)
         self.book_combo.currentTextChanged.connect(lambda _: self.reset_enter_state())
         self.chapter_input.currentIndexChanged.connect(lambda _: self.reset_enter_state())
         self.verse_input.textChanged.connect(lambda _: self.reset_enter_state())
 
+    @cached_property
+    def logic(self):
+        """
+        Verse lookup and navigation logic, created on first use.
+
+        :return: Logic handler bound to this tab's data and settings
+        :rtype: TabVerseLogic
+        """
+        return TabVerseLogic(self.bible_data, self.tr, self.settings, self.current_language)
+
+    @cached_property
+    def output_handler(self):
+        """
+        Output box writer, created on first use.
+
+        :return: Handler writing formatted verses to the display box
+        :rtype: VerseOutputHandler
+        """
+        return VerseOutputHandler(self.display_box, self.settings)
+
     def change_language(self, lang_code):
         """
         Dynamically updates UI labels when the language changes.
@@ -82,46 +126,46 @@ class TabVerse(QWidget, TabVerseUI):
         self.current_language = lang_code
         self.messages = load_messages(lang_code)
 
-        selected_versions = self.version_helper.get_selected_versions()
-        summary = (
-            ", ".join([self.bible_data.aliases_version.get(v, v) for v in selected_versions])
-            if selected_versions and self.use_alias else
-            ", ".join(selected_versions) if selected_versions else
-            self.tr("msg_nothing")
-        )
-        self.version_summary_label.setText(summary)
+        # Rendered verses embed translated labels; only an already-created logic holds any
+        if "logic" in self.__dict__:
+            self.logic.clear_render_cache()
 
-        # Update labels and placeholders
-        self.book_label.setText(self.tr("label_book"))
-        self.chapter_label.setText(self.tr("label_chapter"))
-        self.verse_label.setText(self.tr("label_verse"))
-        self.verse_input.setPlaceholderText(self.tr("verse_input_hint"))
+        # Relabel everything in one repaint
+        self.setUpdatesEnabled(False)
+        try:
+            selected_versions = self.version_helper.get_selected_versions()
+            summary = (
+                self.selection_manager.format_version_summary(self, selected_versions)
+                if selected_versions else self.tr("msg_nothing")
+            )
+            self.version_summary_label.setText(summary)
 
-        self.selection_manager.populate_book_dropdown(self)
+            # Update labels, placeholders and button texts
+            tr = self.tr
+            for attr, setter, key in self._LANG_SPEC:
+                getattr(getattr(self, attr), setter)(tr(key))
 
-        if hasattr(self, "alias_toggle_btn"):
-            self.alias_toggle_btn.setText(
-                self.tr("label_alias_short") if self.use_alias else self.tr("label_alias_full")
-            )
+            self.selection_manager.populate_book_dropdown(self)
 
-        self.selection_manager.update_book_dropdown(self, self.current_language)
+            if self.alias_toggle_btn is not None:
+                self.alias_toggle_btn.setText(
+                    self.tr("label_alias_short") if self.use_alias else self.tr("label_alias_full")
+                )
 
-        # Update button texts
-        self.prev_verse_btn.setText(self.tr("btn_prev"))
-        self.search_btn.setText(self.tr("btn_search"))
-        self.save_btn.setText(self.tr("btn_output"))
-        self.next_verse_btn.setText(self.tr("btn_next"))
-        self.clear_display_btn.setText(self.tr("btn_clear"))
+            self.selection_manager.update_book_dropdown(self, self.current_language)
+        finally:
+            self.setUpdatesEnabled(True)
 
     def resizeEvent(self, event):
         """
-        Responds to window resize events and updates the version layout.
+        Responds to window resize events and schedules a version layout update
+        once resizing pauses for 50 ms.
 
         :param event: Resize event object
         :type event: QResizeEvent
         """
         super().resizeEvent(event)
-        self.selection_manager.update_grid_layout(self)
+        self._resize_timer.start()
 
     def update_button_layout(self):
         """
@@ -129,23 +173,14 @@ class TabVerse(QWidget, TabVerseUI):
         """
         poll_enabled = self.get_polling_status()
         always_show = self.get_always_show_setting()
-        effective_polling = poll_enabled or always_show
-
-        # Clear all existing buttons
-        while self.button_layout.count():
-            item = self.button_layout.takeAt(0)
-            widget = item.widget()
-            if widget:
-                widget.setParent(None)
-
-        # Re-add buttons based on conditions
-        self.button_layout.addWidget(self.prev_verse_btn)
-        self.button_layout.addWidget(self.search_btn)
-        if effective_polling:
-            self.button_layout.addWidget(self.save_btn)
-        self.button_layout.addWidget(self.next_verse_btn)
-        if effective_polling:
-            self.button_layout.addWidget(self.clear_display_btn)
+        effective_polling = bool(poll_enabled or always_show)
+        if effective_polling == self._last_effective_polling:
+            return
+        self._last_effective_polling = effective_polling
+
+        # All buttons live in the layout permanently; hidden widgets take no space
+        self.save_btn.setVisible(effective_polling)
+        self.clear_display_btn.setVisible(effective_polling)
 
     def get_polling_status(self):
         """
@@ -175,28 +210,38 @@ class TabVerse(QWidget, TabVerseUI):
         self.alias_toggle_btn.setText(
             self.tr("label_alias_short") if self.use_alias else self.tr("label_alias_full")
         )
-        self.update_version_summary(self)
+        self.selection_manager.update_version_summary(self)
 
     def handle_enter(self):
         """
         Handles Enter key logic for alternating between search and save.
+
+        Searches while nothing is displayed, and saves the displayed verse otherwise.
         """
-        if not self.formatted_verse_text:
-            output = self.logic.display_verse(self.get_reference, self.verse_input, self.apply_output_text)
-            if output:
-                self.formatted_verse_text = output
-                self.enter_state = 1
-        else:
-            try:
-                self.logic.save_verse(self.formatted_verse_text)
-            except Exception as e:
-                print(traceback.format_exc())
-                QMessageBox.critical(
-                    self,
-                    self.tr("error_output_title"),
-                    self.tr("error_output_msg").format(str(e))
-                )
-            self.enter_state = 0
+        self._enter_actions[bool(self.formatted_verse_text)]()
+
+    def _enter_search(self):
+        """
+        First Enter: looks up and displays the verse from the input fields.
+        """
+        # apply_output_text has already stored the rendered text in formatted_verse_text
+        if self.logic.display_verse(self.get_reference, self.verse_input, self.apply_output_text):
+            self.enter_state = 1
+
+    def _enter_save(self):
+        """
+        Second Enter: saves the displayed verse to the output file.
+        """
+        try:
+            self.logic.save_verse(self.formatted_verse_text)
+        except Exception as e:
+            print(traceback.format_exc())
+            QMessageBox.critical(
+                self,
+                self.tr("error_output_title"),
+                self.tr("error_output_msg").format(str(e))
+            )
+        self.enter_state = 0
 
     def get_reference(self):
         """
@@ -205,8 +250,6 @@ class TabVerse(QWidget, TabVerseUI):
         :return: (versions, book, chapter, (start_verse, end_verse))
         :rtype: tuple
         """
-        from core.logic.verse_logic import resolve_reference
-
         version_list = self.version_helper.get_selected_versions()
         book_str = self.book_combo.currentText()
         chapter_str = self.chapter_input.currentText()
@@ -217,6 +260,8 @@ class TabVerse(QWidget, TabVerseUI):
         """
         Displays formatted verse text in the main display box.
 
+        This is the only place a lookup writes `formatted_verse_text`.
+
         :param text: Formatted text to show
         :type text: str
         """
@@ -233,17 +278,23 @@ class TabVerse(QWidget, TabVerseUI):
         """
         try:
             self.logic.delta = delta
-            new_val = self.logic.shift_verse(self.get_reference, self.verse_input)
-            if new_val:
-                output = self.logic.display_verse(self.get_reference, self.verse_input, self.apply_output_text)
-                if output:
-                    self.formatted_verse_text = output
+            new_ref, error = self.logic.shift_verse(self.get_reference, self.verse_input)
         except Exception:
+            # Unparsable input from get_reference
+            error = "invalid_reference"
+
+        if error:
             QMessageBox.warning(
                 self,
                 self.tr("warn_jump_title"),
                 self.tr("warn_jump_msg")
             )
+            return
+
+        if new_ref:
+            if self.logic.display_verse(lambda: new_ref, self.verse_input, self.apply_output_text):
+                # Warm the next verse in the same direction once this one is on screen
+                QTimer.singleShot(0, lambda: self.logic.prefetch_neighbor(delta))
 
     def reset_enter_state(self):
         """
@@ -257,4 +308,4 @@ class TabVerse(QWidget, TabVerseUI):
         Clears the displayed verse and the output file.
         """
         self.display_box.clear()
-        save_to_files("", self.settings)
\ No newline at end of file
+        save_to_files_async("", self.settings)
\ No newline at end of file
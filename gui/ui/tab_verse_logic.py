@@ -12,6 +12,15 @@ Copyright (c) 2025 The Eulji-ro Presbyterian Church.
 License: MIT License with Attribution Requirement (see LICENSE file for details)
 """
 
+from collections import OrderedDict
+
+from core.logic.verse_logic import display_verse_logic, shift_verse_value
+from core.utils.bible_parser import resolve_book_name
+from core.utils.utils_output import format_output, save_to_files_async
+
+# Number of rendered references kept for repeated Search/Enter on the same passage
+_RENDER_CACHE_SIZE = 32
+
 
 class TabVerseLogic:
     """
@@ -40,10 +49,15 @@ class TabVerseLogic:
         self.tr = tr_func
         self.settings = settings
         self.current_language = current_language
+        self._render_cache = OrderedDict()
+        self._last_key = None  # Cache key of the most recently displayed reference
 
     def display_verse(self, ref_func, verse_input, apply_output_text):
         """
-        Renders and returns a formatted Bible verse using internal display logic.
+        Renders a formatted Bible verse using internal display logic.
+
+        The rendered text, or the warning shown in its place, reaches the UI only through
+        `apply_output_text`; the return value just reports which of the two happened.
 
         :param ref_func: Function returning (versions, book, chapter, verse_range, warning)
         :type ref_func: Callable
@@ -51,14 +65,30 @@ class TabVerseLogic:
         :type verse_input: QLineEdit
         :param apply_output_text: Callback to apply rendered text to the UI
         :type apply_output_text: Callable
-        :return: Final rendered verse text, or None if failed
-        :rtype: str | tuple | None
+        :return: True if a verse was rendered, False if a warning was shown instead
+        :rtype: bool
         """
-        from core.logic.verse_logic import display_verse_logic
+        try:
+            ref = ref_func()
+        except Exception:
+            # Invalid references are reported by display_verse_logic itself
+            ref = None
+
+        # References that resolved without a warning are rendered once and reused
+        key = None
+        if ref is not None and not ref[4]:
+            versions, book, chapter, verse_range, _ = ref
+            key = (tuple(versions), book, chapter, verse_range, self.current_language)
+            cached = self._render_cache.get(key)
+            if cached is not None:
+                self._render_cache.move_to_end(key)
+                self._last_key = key
+                apply_output_text(cached)
+                return True
 
         # Invoke display logic with injected dependencies
         output = display_verse_logic(
-            ref_func,
+            ref_func if ref is None else (lambda: ref),
             verse_input,
             self.bible_data,
             self.tr,
@@ -66,21 +96,82 @@ class TabVerseLogic:
             self.current_language,
             apply_output_text
         )
-        return output
+
+        self._last_key = key if output else None
+        if key is not None and output:
+            self._remember(key, output)
+        return bool(output)
+
+    def prefetch_neighbor(self, delta):
+        """
+        Renders the verse one step from the last displayed single verse into the render cache,
+        so the next Prev/Next press in that direction is served without formatting.
+
+        Meant to run from the event loop after the current verse has been painted.
+
+        :param delta: Direction of travel, +1 for next, -1 for previous
+        :type delta: int
+        """
+        if self._last_key is None:
+            return
+        versions, book, chapter, (start, end), lang_code = self._last_key
+        if start != end or lang_code != self.current_language:
+            return
+
+        max_verse = self.bible_data.get_max_verse(versions[0], book, chapter)
+        if max_verse == 0:
+            return
+        target = shift_verse_value(start, delta, max_verse)
+        key = (versions, book, chapter, (target, target), lang_code)
+        if target == start or key in self._render_cache:
+            return
+
+        # Same formatting display_verse_logic applies to a GUI lookup, without any UI output
+        output = format_output(
+            list(versions), book, chapter, (target, target),
+            {v: self.bible_data.get_verses(v) for v in versions},
+            self.tr, lang_code=lang_code,
+            version_alias=self.bible_data.get_version_alias(lang_code),
+            book_alias=self.bible_data.get_book_alias(lang_code),
+            for_whitebox=False
+        )
+        if output:
+            self._remember(key, output)
+
+    def _remember(self, key, output):
+        """
+        Stores rendered text in the render cache, evicting the least recently used entry when full.
+
+        :param key: (versions, book, chapter, verse_range, language) tuple
+        :type key: tuple
+        :param output: Rendered verse text
+        :type output: str
+        """
+        self._render_cache[key] = output
+        self._render_cache.move_to_end(key)
+        if len(self._render_cache) > _RENDER_CACHE_SIZE:
+            self._render_cache.popitem(last=False)
+
+    def clear_render_cache(self):
+        """
+        Drops all rendered references, e.g. after the UI language changed the translated labels.
+        """
+        self._render_cache.clear()
+        self._last_key = None
 
     def save_verse(self, formatted_verse_text):
         """
-        Saves the formatted verse to the configured output file.
+        Queues the formatted verse for writing to the configured output file.
+
+        The write happens on the background output writer so the UI does not wait on the disk.
 
         :param formatted_verse_text: Verse text to save
         :type formatted_verse_text: str
         :raises Exception: If saving fails
         """
-        from core.utils.utils_output import save_to_files
-
         try:
             text = formatted_verse_text or ""
-            save_to_files(text, self.settings)
+            save_to_files_async(text, self.settings)
         except Exception as e:
             raise Exception(f"Failed to save verse: {e}")
 
@@ -92,37 +183,37 @@ class TabVerseLogic:
         :type ref_func: Callable
         :param verse_input_widget: The input widget to update with new verse
         :type verse_input_widget: QLineEdit
-        :return: New verse number or None if shifting is not possible
-        :rtype: int | None
+        :return: (reference, error) where reference is the new verse in the shape ref_func returns
+                 and error is None, or reference is None and error names the failed check
+                 ("unknown_book", "not_single_verse", "no_verses"); both are None when no
+                 version is selected
+        :rtype: tuple[tuple | None, str | None]
         """
-        from core.logic.verse_logic import shift_verse_value
-        from core.utils.bible_parser import resolve_book_name
-
         # Extract reference info from ref_func
         versions, book, chapter, verse_range, warning = ref_func()
         if not versions:
-            return None
+            return None, None
 
         version = versions[0]
 
         # Normalize book name using internal parser
         book = resolve_book_name(book, self.bible_data, self.current_language)
         if book not in self.bible_data.get_verses(version):
-            raise Exception(f"Book '{book}' not found in version '{version}'")
-
-        if not isinstance(verse_range, tuple):
-            raise Exception("verse_range is not a tuple")
+            return None, "unknown_book"
 
-        if verse_range[0] != verse_range[1]:
-            raise Exception("Cannot shift a verse range")
+        # Only a single verse can be shifted, not a range
+        if not isinstance(verse_range, tuple) or verse_range[0] != verse_range[1]:
+            return None, "not_single_verse"
 
         # Extract and validate current verse number
         current = verse_range[0]
         max_verse = self.bible_data.get_max_verse(version, book, chapter)
         if max_verse == 0:
-            raise Exception(f"No verses found for {book} {chapter}")
+            return None, "no_verses"
 
         # Calculate and apply new verse number
         new_val = shift_verse_value(current, self.delta, max_verse)
         verse_input_widget.setText(str(new_val))
-        return new_val
\ No newline at end of file
+
+        # The new reference is fully known here; callers display it without re-parsing the inputs
+        return (versions, book, chapter, (new_val, new_val), None), None
\ No newline at end of file
@@ -13,13 +13,20 @@ License: MIT License with Attribution Requirement (see LICENSE file for details)
 """
 
 import platform
-from PySide6.QtWidgets import QMessageBox, QCheckBox
+from PySide6.QtCore import QSignalBlocker, QTimer
+from PySide6.QtWidgets import QMessageBox
 
 from core.utils.bible_parser import resolve_book_name
 from core.utils.logger import log_debug
 from gui.ui.common import create_checkbox
 from gui.utils.logger import log_error_with_dialog
 
+# Windows needs wider columns and less usable width due to scrollbar/rendering differences
+if platform.system() == "Windows":
+    _COLUMN_WIDTH, _USABLE_RATIO = 190, 0.6
+else:
+    _COLUMN_WIDTH, _USABLE_RATIO = 170, 0.7
+
 
 class TabVerseSelectionManager:
     """
@@ -45,6 +52,20 @@ class TabVerseSelectionManager:
         self.bible_data = bible_data
         self.version_helper = version_helper
         self.tr = tr_func
+        self._version_checkboxes = []  # In creation order, which is also grid order
+        self._grid_shape = None  # (columns, item count) of the last grid placement
+        self._summary_timer = None  # Coalesces rapid checkbox toggles; created on first toggle
+        self._book_combo_state = None  # (common books, language, first version) the book combo shows
+        self._chapter_combo_key = None  # (version, book) whose chapters the chapter combo lists
+        self._summary = None  # ((versions, use_alias), summary text) of the last summary built
+        self._book_display_cache = {}  # (language, common books) -> [(display name, book key), ...]
+
+        # Exact combo texts (any language's standard name, or the key itself) -> book key
+        self._display_to_book = {}
+        for book_key, names in bible_data.standard_book.items():
+            self._display_to_book.setdefault(book_key, book_key)
+            for name in names.values():
+                self._display_to_book.setdefault(name, book_key)
 
     def create_version_checkbox(self, parent, version_name):
         """
@@ -57,12 +78,30 @@ class TabVerseSelectionManager:
         :rtype: QCheckBox
         """
         label = parent.bible_data.aliases_version.get(version_name, version_name)
-        checkbox = create_checkbox(label, callback=lambda _: self.update_version_summary(parent))
+        checkbox = create_checkbox(label, callback=lambda _: self.on_version_toggled(parent))
         checkbox.version_key = version_name
         checkbox.setToolTip(version_name)
         checkbox.setEnabled(True)
+        self._version_checkboxes.append(checkbox)
         return checkbox
 
+    def on_version_toggled(self, parent):
+        """
+        Drops the cached version selection and schedules a summary refresh after a checkbox toggle.
+
+        Toggles arriving within 50 ms of each other result in a single refresh for the final state.
+
+        :param parent: TabVerse instance owning the toggled checkbox
+        """
+        self.version_helper.invalidate_selection()
+
+        if self._summary_timer is None:
+            self._summary_timer = QTimer(parent)
+            self._summary_timer.setSingleShot(True)
+            self._summary_timer.setInterval(50)
+            self._summary_timer.timeout.connect(lambda: self.update_version_summary(parent))
+        self._summary_timer.start()
+
     def update_grid_layout(self, parent):
         """
         Updates the layout grid for version checkboxes based on platform-specific width.
@@ -70,19 +109,46 @@ class TabVerseSelectionManager:
         :param parent: Parent widget with scroll and layout references
         """
         width = parent.version_scroll.viewport().width()
+        usable_width = int(width * _USABLE_RATIO)
+        columns = max(1, usable_width // _COLUMN_WIDTH)
 
-        # Use different ratios for Windows vs others due to scrollbar/rendering differences
-        if platform.system() == "Windows":
-            column_width = 190
-            usable_width = int(width * 0.6)
-        else:
-            column_width = 170
-            usable_width = int(width * 0.7)
+        # Resizes that keep the column count need no re-placement
+        shape = (columns, len(self._version_checkboxes))
+        if shape == self._grid_shape:
+            return
+        self._grid_shape = shape
 
-        columns = max(1, usable_width // column_width)
+        # One repaint for the whole re-placement instead of one per moved checkbox
+        parent.version_widget.setUpdatesEnabled(False)
+        try:
+            for idx, checkbox in enumerate(self._version_checkboxes):
+                parent.version_layout.addWidget(checkbox, idx // columns, idx % columns)
+        finally:
+            parent.version_widget.setUpdatesEnabled(True)
 
-        for idx, checkbox in enumerate(parent.version_widget.findChildren(QCheckBox)):
-            parent.version_layout.addWidget(checkbox, idx // columns, idx % columns)
+    def format_version_summary(self, parent, selected_versions):
+        """
+        Returns the comma-separated summary of selected versions, using aliases if enabled.
+
+        The last result is reused while the selection and alias mode are unchanged.
+
+        :param parent: TabVerse instance providing bible_data and use_alias
+        :param selected_versions: Selected version keys (non-empty)
+        :type selected_versions: list[str]
+        :return: Summary text for the version label
+        :rtype: str
+        """
+        key = (tuple(selected_versions), parent.use_alias)
+        if self._summary is not None and self._summary[0] == key:
+            return self._summary[1]
+
+        if parent.use_alias:
+            alias_map = parent.bible_data.aliases_version
+            summary = ", ".join(alias_map.get(v, v) for v in selected_versions)
+        else:
+            summary = ", ".join(selected_versions)
+        self._summary = (key, summary)
+        return summary
 
     def update_version_summary(self, parent):
         """
@@ -96,10 +162,7 @@ class TabVerseSelectionManager:
         selected_versions = parent.version_helper.get_selected_versions()
 
         if selected_versions:
-            if parent.use_alias:
-                summary = ", ".join([parent.bible_data.aliases_version.get(v, v) for v in selected_versions])
-            else:
-                summary = ", ".join(selected_versions)
+            summary = self.format_version_summary(parent, selected_versions)
         else:
             summary = parent.tr("msg_nothing")
             QMessageBox.warning(
@@ -107,7 +170,9 @@ class TabVerseSelectionManager:
                 parent.tr("warn_version_title"),
                 parent.tr("warn_version_msg")
             )
+            self._book_combo_state = None
             parent.book_combo.clear()
+            self._chapter_combo_key = None
             parent.chapter_input.clear()
             parent.verse_input.clear()
             return
@@ -115,16 +180,34 @@ class TabVerseSelectionManager:
         parent.version_summary_label.setText(summary)
         self.update_book_dropdown(parent, parent.current_language)
 
-        for v in selected_versions:
-            try:
-                log_debug(f"[TabVerse] selected versions: {parent.version_helper.get_selected_versions()}")
-            except Exception as e:
-                log_error_with_dialog(e)
-                QMessageBox.critical(
-                    parent,
-                    parent.tr("error_loading_title"),
-                    parent.tr("error_loading_msg").format(v, e)
-                )
+        try:
+            log_debug(f"[TabVerse] selected versions: {selected_versions}")
+        except Exception as e:
+            log_error_with_dialog(e)
+            QMessageBox.critical(
+                parent,
+                parent.tr("error_loading_title"),
+                parent.tr("error_loading_msg").format(", ".join(selected_versions), e)
+            )
+
+    def _resolve_book(self, text, lang_code):
+        """
+        Resolves book combo text to its internal book key.
+
+        Standard names, as the combo lists them, are a single dict probe; anything else the
+        user typed (aliases, abbreviations) goes through `resolve_book_name`.
+
+        :param text: Stripped combo box text
+        :type text: str
+        :param lang_code: Language code ('ko' or 'en')
+        :type lang_code: str
+        :return: Internal book key, or None if unknown
+        :rtype: str | None
+        """
+        book = self._display_to_book.get(text)
+        if book is not None:
+            return book
+        return resolve_book_name(text, self.bible_data.standard_book, lang_code)
 
     def populate_book_dropdown(self, parent, lang_code=None):
         """
@@ -137,15 +220,15 @@ class TabVerseSelectionManager:
         if lang_code is None:
             lang_code = "ko"
 
-        parent.book_combo.blockSignals(True)
-        parent.book_combo.clear()
+        self._book_combo_state = None
+        with QSignalBlocker(parent.book_combo):
+            parent.book_combo.clear()
 
-        for book_key, names in parent.bible_data.standard_book.items():
-            display_name = names.get(lang_code, book_key)
-            parent.book_combo.addItem(display_name)
+            for book_key, names in parent.bible_data.standard_book.items():
+                display_name = names.get(lang_code, book_key)
+                parent.book_combo.addItem(display_name)
 
-        parent.book_combo.setCurrentIndex(0)
-        parent.book_combo.blockSignals(False)
+            parent.book_combo.setCurrentIndex(0)
 
     def update_book_dropdown(self, parent, lang_code=None):
         """
@@ -164,22 +247,23 @@ class TabVerseSelectionManager:
 
         if not versions:
             # Clear all inputs if no versions are selected
-            parent.book_combo.blockSignals(True)
-            parent.book_combo.clear()
-            parent.book_combo.blockSignals(False)
+            self._book_combo_state = None
+            with QSignalBlocker(parent.book_combo):
+                parent.book_combo.clear()
+            self._chapter_combo_key = None
             parent.chapter_input.clear()
             parent.verse_input.clear()
             return
 
         # Validate and get common books
-        common_books = self.version_helper.get_common_books()
         versions, common_books = self.version_helper.validate_selection()
 
         if not common_books:
             # Warn user if no books are shared among selected versions
-            parent.book_combo.blockSignals(True)
-            parent.book_combo.clear()
-            parent.book_combo.blockSignals(False)
+            self._book_combo_state = None
+            with QSignalBlocker(parent.book_combo):
+                parent.book_combo.clear()
+            self._chapter_combo_key = None
             parent.chapter_input.clear()
             parent.verse_input.clear()
             QMessageBox.warning(
@@ -189,19 +273,32 @@ class TabVerseSelectionManager:
             )
             return
 
+        # Same books in the same language: the combo and the chapter list are already current
+        state = (tuple(common_books), lang_code, versions[0])
+        if state == self._book_combo_state:
+            return
+
         # Backup current selections
         current_display_text = parent.book_combo.currentText().strip()
-        current_book_eng = resolve_book_name(current_display_text, lang_code)
+        current_book_eng = self._resolve_book(current_display_text, lang_code)
         current_chapter = parent.chapter_input.currentText().strip()
         current_verse = parent.verse_input.text().strip()
 
-        # Update the book dropdown list
-        parent.book_combo.blockSignals(True)
-        parent.book_combo.clear()
-        for book in common_books:
-            display_name = self.bible_data.get_standard_book(book, lang_code)
-            parent.book_combo.addItem(display_name, userData=book)
-        parent.book_combo.blockSignals(False)
+        # Update the book dropdown list; display names are looked up once per book set and language
+        display_key = (lang_code, state[0])
+        book_items = self._book_display_cache.get(display_key)
+        if book_items is None:
+            book_items = [(self.bible_data.get_standard_book(book, lang_code), book) for book in common_books]
+            self._book_display_cache[display_key] = book_items
+
+        parent.book_combo.setUpdatesEnabled(False)
+        try:
+            with QSignalBlocker(parent.book_combo):
+                parent.book_combo.clear()
+                for display_name, book in book_items:
+                    parent.book_combo.addItem(display_name, userData=book)
+        finally:
+            parent.book_combo.setUpdatesEnabled(True)
 
         # Try to restore previous selection
         found = False
@@ -224,6 +321,7 @@ class TabVerseSelectionManager:
         self.update_chapter_dropdown(parent)
         parent.chapter_input.setCurrentText(current_chapter)
         parent.verse_input.setText(current_verse)
+        self._book_combo_state = state
 
     def update_chapter_dropdown(self, parent):
         """
@@ -239,21 +337,27 @@ class TabVerseSelectionManager:
         book_display = parent.book_combo.currentText().strip()
 
         # Resolve internal book name
-        book = resolve_book_name(book_display, parent.bible_data, parent.current_language)
+        book = self._resolve_book(book_display, parent.current_language)
 
         if not book:
+            self._chapter_combo_key = None
             parent.chapter_input.clear()
             return
 
-        if book in parent.bible_data.get_verses(version):
-            # Get chapter numbers from the version's verse structure
-            chapters = parent.bible_data.get_verses(version).get(book, {}).keys()
-            max_chapter = max(int(ch) for ch in chapters)
+        # Still the same book (e.g. while its name is being typed): the chapter list is current
+        key = (version, book)
+        if key == self._chapter_combo_key:
+            return
 
-            parent.chapter_input.blockSignals(True)
-            parent.chapter_input.clear()
-            parent.chapter_input.addItems([str(i) for i in range(1, max_chapter + 1)])
-            parent.chapter_input.setEditText("")
-            parent.chapter_input.blockSignals(False)
+        if book in parent.bible_data.get_verses(version):
+            # Chapter numbers from the version's verse structure, computed once per book
+            chapter_labels = parent.bible_data.get_chapter_labels(version, book)
+
+            with QSignalBlocker(parent.chapter_input):
+                parent.chapter_input.clear()
+                parent.chapter_input.addItems(chapter_labels)
+                parent.chapter_input.setEditText("")
+            self._chapter_combo_key = key
         else:
+            self._chapter_combo_key = None
             parent.chapter_input.clear()
\ No newline at end of file
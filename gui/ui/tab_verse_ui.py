@@ -152,12 +152,14 @@ class TabVerseUI:
         self.button_layout = button_layout
         button_layout.addWidget(self.prev_verse_btn)
         button_layout.addWidget(self.search_btn)
-        poll_enabled = self.settings.get("poll_enabled", False)
-        if poll_enabled:
-            button_layout.addWidget(self.save_btn)
+        button_layout.addWidget(self.save_btn)
         button_layout.addWidget(self.next_verse_btn)
-        if poll_enabled:
-            button_layout.addWidget(self.clear_display_btn)
+        button_layout.addWidget(self.clear_display_btn)
+
+        # Output/clear buttons stay in the layout and are only hidden when polling is off
+        if not self.settings.get("poll_enabled", False):
+            self.save_btn.hide()
+            self.clear_display_btn.hide()
 
         # Add button row to the input layout
         input_layout.addLayout(button_layout)
@@ -196,15 +198,14 @@ class TabVerseUI:
         """
         Trigger display of Bible verse when Search button is clicked.
 
-        Uses `self.get_reference`, `self.verse_input`, and `self.apply_output_text`.
+        Uses `self.get_reference`, `self.verse_input`, and `self.apply_output_text`,
+        which also stores the rendered text in `self.formatted_verse_text`.
         """
-        output = self.logic.display_verse(
+        self.logic.display_verse(
             self.get_reference,
             self.verse_input,
             self.apply_output_text
         )
-        if output:
-            self.formatted_verse_text = output
 
     def _on_save_verse(self):
         """
@@ -141,7 +141,8 @@ class WindowMain(QMainWindow):
         self.tabs.addTab(self.tab_settings, self.tr("tab_font"))
         self.apply_tab_icons()
 
-        self.tab_settings.apply_dynamic_settings()
+        # Re-apply now that the tab is parented and the refresh callback is wired
+        self.tab_settings.apply_dynamic_settings(force=True)
 
         layout.addWidget(self.poll_toggle_btn)
 
@@ -151,6 +152,7 @@ class WindowMain(QMainWindow):
         layout.addWidget(self.copyright_label)
 
         self.setCentralWidget(central_widget)
+        self.tab_settings.watch_main_window()
 
         self.tab_verse.update_button_layout()
         self.tab_keyword.update_button_visibility()
@@ -228,8 +230,24 @@ class WindowMain(QMainWindow):
         
         ConfigManager.update_partial({"last_language": lang_code})
 
-    def refresh_settings_and_tabs(self):
-        self.settings = ConfigManager.load()
+    def refresh_settings_and_tabs(self, updated=None):
+        """
+        Syncs settings and refreshes tab button layouts.
+
+        Args:
+            updated (dict, optional): Settings just changed in memory. When given, they are merged
+                instead of reloading from disk, and tabs are refreshed only if the on/off
+                button visibility changed. Defaults to None (full reload and refresh).
+        """
+        if updated is None:
+            self.settings = ConfigManager.load()
+        else:
+            key = "always_show_on_off_buttons"
+            layout_changed = key in updated and updated[key] != self.settings.get(key)
+            self.settings = {**self.settings, **updated}
+            if not layout_changed:
+                return
+
         self.tab_verse.update_button_layout()
         self.tab_keyword.update_button_visibility()
         self.tab_settings.update_presentation_visibility()
@@ -25,8 +25,8 @@ def update_overlay_settings(settings, widget_overlays):
                 - "size_combo" (QComboBox): Font size selector
                 - "weight_combo" (QComboBox): Font weight selector
                 - "alpha_slider" (QSlider): Background transparency slider
-                - "text_color_btn" (QPushButton): Text color preview button
-                - "bg_color_btn" (QPushButton): Background color preview button
+                - "text_color_btn" (QPushButton): Text color preview button (color in `color_hex`)
+                - "bg_color_btn" (QPushButton): Background color preview button (color in `color_hex`)
                 - "mode_combo" (QComboBox): Overlay mode selector ("fullscreen" or "resizable")
 
     Returns:
@@ -36,8 +36,8 @@ def update_overlay_settings(settings, widget_overlays):
     font_size = int(widget_overlays["font_size_combo"].currentText())
     font_weight = widget_overlays["font_weight_combo"].currentData()
     alpha = round(widget_overlays["alpha_slider"].value() / 100.0, 2)
-    text_color = widget_overlays["text_color_btn"].palette().button().color().name()
-    bg_color = widget_overlays["bg_color_btn"].palette().button().color().name()
+    text_color = widget_overlays["text_color_btn"].color_hex
+    bg_color = widget_overlays["bg_color_btn"].color_hex
     mode = "fullscreen" if widget_overlays["mode_combo"].currentIndex() == 0 else "resizable"
 
     settings.update({
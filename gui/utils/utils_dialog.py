@@ -12,21 +12,22 @@ Copyright (c) 2025 The Eulji-ro Presbyterian Church.
 License: MIT License with Attribution Requirement (see LICENSE file for details)
 """
 
-from PySide6.QtWidgets import QFileDialog, QColorDialog
+from PySide6.QtWidgets import QFileDialog
 from gui.config.config_manager import ConfigManager
+from gui.ui.common import set_button_color
 
-def set_color_from_dialog(button, setting_key, callback=None):
+def apply_picked_color(color, button, setting_key, callback=None):
     """
-    Opens QColorDialog, updates button color, saves to settings, and runs callback.
+    Applies a color chosen in a color dialog: updates the button, saves it, and runs callback.
 
     Args:
+        color (QColor): The chosen color; invalid colors (cancelled dialog) are ignored.
         button (QPushButton): The button to update the background color of.
         setting_key (str): Settings dictionary key to update.
         callback (function, optional): Function to call after color is applied.
     """
-    color = QColorDialog.getColor()
     if color.isValid():
-        button.setStyleSheet(f"background-color: {color.name()}")
+        set_button_color(button, color.name())
         ConfigManager.update_partial({setting_key: color.name()})
         if callback:
             callback()
@@ -13,14 +13,31 @@ License: MIT License with Attribution Requirement (see LICENSE file for details)
 """
 
 import json
-from PySide6.QtGui import QFont
-from PySide6.QtWidgets import QWidget, QApplication
+from PySide6.QtGui import QFont, QFontDatabase
+from PySide6.QtWidgets import QApplication
 
 from core.config import paths
 from gui.constants import messages
 from gui.utils.logger import handle_exception
 from gui.config.config_manager import ConfigManager
 
+# Scalable font families, enumerated once per process by get_scalable_families
+_scalable_families = None
+
+def get_scalable_families():
+    """
+    Returns the installed scalable font families, scanning the font database only on first call.
+
+    Returns:
+        tuple[str, ...]: Scalable font family names.
+    """
+    global _scalable_families
+    if _scalable_families is None:
+        _scalable_families = tuple(
+            family for family in QFontDatabase.families() if QFontDatabase.isScalable(family)
+        )
+    return _scalable_families
+
 def create_app_font(family: str, size: int, weight_value: int) -> QFont:
     """
     Creates a QFont instance with the given settings.
@@ -64,15 +81,16 @@ def load_application_settings(app):
 
 def apply_font_to_children(widget, font):
     """
-    Recursively applies the given font to the specified widget and all its child widgets.
+    Applies the given font to the specified widget.
+
+    Child widgets without an explicitly set font inherit it through Qt's font propagation,
+    so the widget tree is not walked.
 
     Args:
         widget (QWidget): The root widget to apply the font to.
         font (QFont): The font to apply.
     """
     widget.setFont(font)
-    for child in widget.findChildren(QWidget):
-        child.setFont(font)
 
 def apply_main_font_to_app(font_family, font_size, font_weight, root_widget):
     """
@@ -82,7 +100,7 @@ def apply_main_font_to_app(font_family, font_size, font_weight, root_widget):
         font_family (str): Font family name.
         font_size (int): Font size.
         font_weight (QFont.Weight): Font weight enum.
-        root_widget (QWidget): Root widget to apply font recursively.
+        root_widget (QWidget): Root widget whose children inherit the font.
     """
     ConfigManager.save_font(font_family, font_size, font_weight)
     font = QApplication.font()
@@ -14,8 +14,6 @@ License: MIT License with Attribution Requirement (see LICENSE file for details)
 
 from core.utils.logger import log_debug
 from gui.config.config_manager import ConfigManager
-from gui.constants import messages
-from gui.utils.logger import handle_exception
 
 def save_user_settings(app, win):
     """
@@ -33,18 +31,16 @@ def save_user_settings(app, win):
     chapter_input = tab_verse.chapter_input
     verse_input = tab_verse.verse_input
 
-    try:
-        current_settings = ConfigManager.load()
-        current_settings.update({
-            "font_family": app.font().family(),
-            "font_size": app.font().pointSize(),
-            "last_versions": selected_versions,
-            "last_book": book_combo.currentText(),
-            "last_chapter": int(chapter_input.currentText()) if chapter_input.currentText().isdigit() else 1,
-            "last_verse": verse_input.text(),
-            "dark_mode": bool(app.styleSheet())
-        })
-        ConfigManager.save(current_settings)
-        log_debug(f'Settings saved: {current_settings}')
-    except Exception as e:
-        handle_exception(e, "Settings Save Error", messages.ERROR_MESSAGES["settings_save"])
\ No newline at end of file
+    # The write is queued; ConfigManager reports (and logs) write failures itself
+    current_settings = ConfigManager.load()
+    current_settings.update({
+        "font_family": app.font().family(),
+        "font_size": app.font().pointSize(),
+        "last_versions": selected_versions,
+        "last_book": book_combo.currentText(),
+        "last_chapter": int(chapter_input.currentText()) if chapter_input.currentText().isdigit() else 1,
+        "last_verse": verse_input.text(),
+        "dark_mode": bool(app.styleSheet())
+    })
+    ConfigManager.save(current_settings)
+    log_debug(f'Settings saved: {current_settings}')
\ No newline at end of file
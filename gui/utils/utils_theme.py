@@ -14,15 +14,32 @@ License: MIT License with Attribution Requirement (see LICENSE file for details)
 
 import qdarkstyle
 
+# qdarkstyle CSS, loaded from the package on first use
+_dark_stylesheet = None
+
+def get_dark_stylesheet():
+    """
+    Returns the dark theme stylesheet, loading it only once per process.
+
+    Returns:
+        str: qdarkstyle stylesheet for PySide6.
+    """
+    global _dark_stylesheet
+    if _dark_stylesheet is None:
+        _dark_stylesheet = qdarkstyle.load_stylesheet_pyside6()
+    return _dark_stylesheet
+
 def set_dark_mode(app, enable: bool):
     """
     Applies or removes the application's dark theme.
 
+    Skipped when the app already has the requested stylesheet, since setting it
+    repolishes every widget.
+
     Args:
         app (QApplication): QApplication instance.
         enable (bool): True to apply dark theme, False to revert.
     """
-    if enable:
-        app.setStyleSheet(qdarkstyle.load_stylesheet_pyside6())
-    else:
-        app.setStyleSheet("")
\ No newline at end of file
+    target = get_dark_stylesheet() if enable else ""
+    if app.styleSheet() != target:
+        app.setStyleSheet(target)
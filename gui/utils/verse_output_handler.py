@@ -13,9 +13,9 @@ License: MIT License with Attribution Requirement (see LICENSE file for details)
 """
 
 from PySide6.QtWidgets import QTextEdit
-from PySide6.QtGui import QTextBlockFormat
+from PySide6.QtGui import QTextBlockFormat, QTextCursor
 
-from core.utils.utils_output import save_to_files
+from core.utils.utils_output import save_to_files_async
 
 
 class VerseOutputHandler:
@@ -40,25 +40,34 @@ class VerseOutputHandler:
         self.display_box = display_box
         self.settings = settings
 
+        # 150% line spacing for every block; built once and reused for each verse
+        self.block_format = QTextBlockFormat()
+        self.block_format.setLineHeight(18.0, 4)  # Fixed height, multiplier mode
+
+        # Read-only output: cursor edits below must not pile up undo history
+        self.display_box.setUndoRedoEnabled(False)
+
     def apply_output_text(self, text: str):
         """
         Display the given verse text in the output box with proper formatting.
 
-        Applies a block format with approximately 150% line spacing.
+        Applies a block format with approximately 150% line spacing. The old text is replaced and
+        the new text formatted inside one edit block, so the document is laid out once.
 
         :param text: The verse string to render
         :type text: str
         """
-        # Insert the formatted verse text into the text box
-        self.display_box.setText(text)
+        cursor = QTextCursor(self.display_box.document())
+        cursor.beginEditBlock()
 
-        # Apply 150% line spacing to the entire document
-        cursor = self.display_box.textCursor()
-        cursor.select(cursor.SelectionType.Document)
+        # Replace the whole document, then insert under the spaced block format;
+        # blocks created by the inserted newlines inherit it
+        cursor.select(QTextCursor.Document)
+        cursor.removeSelectedText()
+        cursor.setBlockFormat(self.block_format)
+        cursor.insertText(text)
 
-        block_format = QTextBlockFormat()
-        block_format.setLineHeight(18.0, 4)  # Fixed height, multiplier mode
-        cursor.setBlockFormat(block_format)
+        cursor.endEditBlock()
 
     def save_verse(self, formatted_text: str):
         """
@@ -72,4 +81,4 @@ class VerseOutputHandler:
             formatted_text = ""
 
         # Delegate to output utility to save the content
-        save_to_files(formatted_text, self.settings)
\ No newline at end of file
+        save_to_files_async(formatted_text, self.settings)
\ No newline at end of file